@@ -11,7 +11,6 @@ Key Features:
 - Learning across multiple debugging sessions
 """
 
-import json
 from pathlib import Path
 from pydantic import BaseModel
 from dotenv import load_dotenv
@@ -105,11 +104,13 @@ def example_self_improving_debugger():
     ]
 
     print("\n📋 Error Encounters Log:")
+    lines = []
     for i, encounter in enumerate(all_debug_logs, 1):
-        print(f"\n  Encounter {i} [{encounter.error_id}]:")
-        print(f"    Error: {encounter.error_message}")
-        print(f"    Solutions proposed: {len(encounter.solutions)}")
-        print(f"    Attempted fixes: {len(encounter.attempted_fixes)}")
+        lines.append(f"\n  Encounter {i} [{encounter.error_id}]:")
+        lines.append(f"    Error: {encounter.error_message}")
+        lines.append(f"    Solutions proposed: {len(encounter.solutions)}")
+        lines.append(f"    Attempted fixes: {len(encounter.attempted_fixes)}")
+    print("\n".join(lines))
 
     # Initialize OMem with LLM-based merge (if API key available)
     print("\n🤖 Initializing debugger memory with intelligent merging...")
@@ -124,7 +125,7 @@ def example_self_improving_debugger():
 
         omem = OMem(
             memory_schema=DebugLog,
-            key_extractor=lambda x: x.error_id,
+            key_extractor="error_id",
             llm_client=llm,
             embedder=None,
             strategy_or_merger=MergeStrategy.LLM.BALANCED,
@@ -133,7 +134,7 @@ def example_self_improving_debugger():
         print(f"   ⚠️  LLM not available ({type(e).__name__}) - using field merge instead")
         omem = OMem(
             memory_schema=DebugLog,
-            key_extractor=lambda x: x.error_id,
+            key_extractor="error_id",
             llm_client=None,
             embedder=None,
             strategy_or_merger=MergeStrategy.MERGE_FIELD,
@@ -154,11 +155,15 @@ def example_self_improving_debugger():
             print(f"   Error Message: {consolidated.error_message}")
             print(f"   Root Cause: {consolidated.root_cause or 'Inferred from multiple encounters'}")
             print(f"\n   📌 All Solutions Found:")
-            for j, solution in enumerate(consolidated.solutions, 1):
-                print(f"      {j}. {solution}")
+            print("\n".join(
+                f"      {j}. {solution}"
+                for j, solution in enumerate(consolidated.solutions, 1)
+            ))
             print(f"\n   ✓ Attempted Fixes:")
-            for j, fix in enumerate(consolidated.attempted_fixes, 1):
-                print(f"      {j}. {fix}")
+            print("\n".join(
+                f"      {j}. {fix}"
+                for j, fix in enumerate(consolidated.attempted_fixes, 1)
+            ))
 
     # Persist to temp directory
     temp_dir = Path(__file__).parent.parent / "temp"
@@ -175,7 +180,7 @@ def example_self_improving_debugger():
     
     omem_restored = OMem(
         memory_schema=DebugLog,
-        key_extractor=lambda x: x.error_id,
+        key_extractor="error_id",
         llm_client=None,
         embedder=None,
         strategy_or_merger=MergeStrategy.MERGE_FIELD,
@@ -10,9 +10,7 @@ Key Features:
 - Progressive NPC opinion and behavior updates
 """
 
-import json
 from pathlib import Path
-from typing import Literal
 from pydantic import BaseModel
 
 from ontomem import OMem
@@ -110,16 +108,18 @@ def example_rpg_npc_memory():
     print(f"\n🎮 NPC: {npc_name}")
     print(f"📝 Encounters with {len({m.player_id for m in all_encounter_memories})} different players:\n")
 
+    lines = []
     for i, memory in enumerate(all_encounter_memories, 1):
-        print(f"  ⚔️  Encounter {i} [Player: {memory.player_id}]:")
-        print(f"     Player Name: {memory.player_name or '(unknown)'}")
-        print(
+        lines.append(f"  ⚔️  Encounter {i} [Player: {memory.player_id}]:")
+        lines.append(f"     Player Name: {memory.player_name or '(unknown)'}")
+        lines.append(
             f"     Titles: {', '.join(memory.titles_earned) or '(none yet)'}"
         )
-        print(
+        lines.append(
             f"     Reputation Events: {len(memory.reputation_events)} events"
         )
-        print(f"     Known Skills: {', '.join(memory.known_skills) or '(unknown)'}")
+        lines.append(f"     Known Skills: {', '.join(memory.known_skills) or '(unknown)'}")
+    print("\n".join(lines))
 
     # Initialize NPC memory with MERGE_FIELD strategy
     print("\n🧠 Building NPC's consolidated memory...")
@@ -127,7 +127,7 @@ def example_rpg_npc_memory():
     
     npc_memory = OMem(
         memory_schema=NPCMemory,
-        key_extractor=lambda x: x.player_id,
+        key_extractor="player_id",
         llm_client=None,
         embedder=None,
         strategy_or_merger=MergeStrategy.MERGE_FIELD,
@@ -141,18 +141,20 @@ def example_rpg_npc_memory():
     print("\n🔍 NPC's Complete Memory Profiles:")
     print("-" * 80)
 
+    lines = []
     for player_id in ["hero_001", "hero_002"]:
         player_profile = npc_memory.get(player_id)
         if player_profile:
-            print(f"\n   📖 Player ID: {player_profile.player_id}")
-            print(f"      Name (Known As): {player_profile.player_name}")
-            print(f"      📜 Titles Earned: {', '.join(player_profile.titles_earned) or '(none)'}")
-            print(f"      🎖️  Reputation Events: {len(player_profile.reputation_events)} events")
-            print(f"      ⚔️  Known Skills: {', '.join(player_profile.known_skills) or '(unknown)'}")
-            print(f"      💰 Trade History: {len(player_profile.trade_history)} transactions")
-            print(f"      📍 Locations: First met {player_profile.first_meeting_location}, Last seen {player_profile.last_known_location}")
-            print(f"      💭 Opinion: {player_profile.npc_opinion or '(developing...)'}")
-            print(f"      💞 Relationship: {player_profile.party_relationship or '(neutral)'}")
+            lines.append(f"\n   📖 Player ID: {player_profile.player_id}")
+            lines.append(f"      Name (Known As): {player_profile.player_name}")
+            lines.append(f"      📜 Titles Earned: {', '.join(player_profile.titles_earned) or '(none)'}")
+            lines.append(f"      🎖️  Reputation Events: {len(player_profile.reputation_events)} events")
+            lines.append(f"      ⚔️  Known Skills: {', '.join(player_profile.known_skills) or '(unknown)'}")
+            lines.append(f"      💰 Trade History: {len(player_profile.trade_history)} transactions")
+            lines.append(f"      📍 Locations: First met {player_profile.first_meeting_location}, Last seen {player_profile.last_known_location}")
+            lines.append(f"      💭 Opinion: {player_profile.npc_opinion or '(developing...)'}")
+            lines.append(f"      💞 Relationship: {player_profile.party_relationship or '(neutral)'}")
+    print("\n".join(lines))
 
     # Persist NPC memory to file
     temp_dir = Path(__file__).parent.parent / "temp"
@@ -11,8 +11,9 @@ Key Features:
 - Batch indexing and search operations
 """
 
-import json
+from collections import Counter, defaultdict
 from pathlib import Path
+import numpy as np
 from pydantic import BaseModel
 from dotenv import load_dotenv
 
@@ -153,12 +154,16 @@ def example_semantic_scholar():
 
     print("\n📚 Loading Research Papers:")
     print("\n   📝 NLP Research Track:")
-    for paper in nlp_papers:
-        print(f"      [{paper.paper_id}] {paper.title} ({paper.year})")
+    print("\n".join(
+        f"      [{paper.paper_id}] {paper.title} ({paper.year})"
+        for paper in nlp_papers
+    ))
 
     print("\n   🖼️  Computer Vision Track:")
-    for paper in cv_papers:
-        print(f"      [{paper.paper_id}] {paper.title} ({paper.year})")
+    print("\n".join(
+        f"      [{paper.paper_id}] {paper.title} ({paper.year})"
+        for paper in cv_papers
+    ))
 
     # Initialize OMem
     print("\n🔧 Initializing paper library...")
@@ -166,14 +171,13 @@ def example_semantic_scholar():
     
     try:
         from langchain_openai import OpenAIEmbeddings
-        from langchain_community.vectorstores import FAISS
 
         embedder = OpenAIEmbeddings(model="text-embedding-3-small")
         print("   ✅ OpenAI API key found - vector search enabled")
 
         library = OMem(
             memory_schema=ResearchPaper,
-            key_extractor=lambda x: x.paper_id,
+            key_extractor="paper_id",
             llm_client=None,
             embedder=embedder,
             strategy_or_merger=MergeStrategy.MERGE_FIELD,
@@ -182,7 +186,7 @@ def example_semantic_scholar():
         print(f"   ⚠️  OpenAI not available - using keyword-only search")
         library = OMem(
             memory_schema=ResearchPaper,
-            key_extractor=lambda x: x.paper_id,
+            key_extractor="paper_id",
             llm_client=None,
             embedder=None,
             strategy_or_merger=MergeStrategy.MERGE_FIELD,
@@ -215,6 +219,14 @@ def example_semantic_scholar():
         "vision image recognition",
         "self-supervised learning",
     ]
+    # Inverted index for the keyword-search fallback: lowercased keyword ->
+    # positions of the papers tagged with it. Built once; a query looks up its
+    # own substrings of each keyword length instead of scanning every keyword
+    papers_by_keyword = defaultdict(set)
+    for pos, p in enumerate(all_papers):
+        for kw in p.keywords:
+            papers_by_keyword[kw.lower()].add(pos)
+    keyword_lengths = sorted({len(kw) for kw in papers_by_keyword})
 
     for query in search_queries:
         print(f"\n   Query: '{query}'")
@@ -230,11 +242,12 @@ def example_semantic_scholar():
                 print("   (Semantic search requires OpenAI API key)")
         except Exception:
             # Fallback: keyword search
-            matching = [
-                p
-                for p in all_papers
-                if any(kw.lower() in query.lower() for kw in p.keywords)
-            ]
+            query_lower = query.lower()
+            positions = set()
+            for n in keyword_lengths:
+                for start in range(len(query_lower) - n + 1):
+                    positions |= papers_by_keyword.get(query_lower[start:start + n], set())
+            matching = [all_papers[pos] for pos in sorted(positions)]
             if matching:
                 print("   Results (by keyword match):")
                 for i, p in enumerate(matching[:2], 1):
@@ -252,29 +265,30 @@ def example_semantic_scholar():
     # Statistics
     print("\n📊 Library Statistics:")
     print("-" * 80)
-    total_citations = sum(p.citations for p in all_papers)
-    avg_year = sum(p.year for p in all_papers) / len(all_papers)
-    all_keywords = set()
-    for p in all_papers:
-        all_keywords.update(p.keywords)
+    # (citations, year) matrix built in one call; all_papers is nlp_papers followed by cv_papers
+    stats = np.array(
+        [(p.citations, p.year) for p in all_papers], dtype=np.int64
+    ).reshape(-1, 2)
+    keyword_freq = Counter(kw for p in all_papers for kw in p.keywords)
+    citations, years = stats[:, 0], stats[:, 1]
+    num_nlp = len(nlp_papers)
+    total_citations = int(citations.sum())
+    avg_year = float(years.mean())
 
     print(f"   Total Papers: {len(all_papers)}")
-    print(f"      • NLP Research: {len(nlp_papers)} papers ({sum(p.citations for p in nlp_papers):,} citations)")
-    print(f"      • Computer Vision: {len(cv_papers)} papers ({sum(p.citations for p in cv_papers):,} citations)")
+    print(f"      • NLP Research: {len(nlp_papers)} papers ({int(citations[:num_nlp].sum()):,} citations)")
+    print(f"      • Computer Vision: {len(cv_papers)} papers ({int(citations[num_nlp:].sum()):,} citations)")
     print(f"\n   Total Citations: {total_citations:,}")
     print(f"   Average Publication Year: {avg_year:.0f}")
-    print(f"   Unique Keywords: {len(all_keywords)}")
-    print(f"   Most Cited Paper: {max(all_papers, key=lambda p: p.citations).title}")
+    print(f"   Unique Keywords: {len(keyword_freq)}")
+    print(f"   Most Cited Paper: {all_papers[int(citations.argmax())].title}")
 
     # Show top keywords
-    keyword_freq = {}
-    for p in all_papers:
-        for kw in p.keywords:
-            keyword_freq[kw] = keyword_freq.get(kw, 0) + 1
-
     print(f"\n   Top Keywords (across all tracks):")
-    for kw, freq in sorted(keyword_freq.items(), key=lambda x: -x[1])[:5]:
-        print(f"      • {kw}: {freq} papers")
+    print("\n".join(
+        f"      • {kw}: {freq} papers"
+        for kw, freq in keyword_freq.most_common(5)
+    ))
 
     print("\n" + "=" * 80)
     print("✨ Research paper library ready for exploration!")
@@ -11,11 +11,11 @@ Key Features:
 - Maintaining data lineage through source tracking
 """
 
-import json
+from collections import defaultdict
+from itertools import chain
 from pathlib import Path
 from pydantic import BaseModel
 from dotenv import load_dotenv
-from datetime import datetime
 
 from ontomem import OMem
 
@@ -169,13 +169,16 @@ def example_multi_source_fusion():
     print("\n📊 Data from Multiple Sources (2 customers):")
     print("-" * 80)
 
-    # Group by customer
-    customers_data = {
-        "cust_42857": ("Sarah Johnson", [r for r in all_customer_records if r.customer_id == "cust_42857"]),
-        "cust_51892": ("Michael Chen", [r for r in all_customer_records if r.customer_id == "cust_51892"]),
-    }
+    # Bucket records by customer in one pass; oldest first so merges see newer data last
+    records_by_customer = defaultdict(list)
+    for record in all_customer_records:
+        records_by_customer[record.customer_id].append(record)
+    for records in records_by_customer.values():
+        records.sort(key=lambda r: r.last_updated or "")
+    customer_names = {"cust_42857": "Sarah Johnson", "cust_51892": "Michael Chen"}
 
-    for cust_id, (name, records) in customers_data.items():
+    for cust_id, records in records_by_customer.items():
+        name = customer_names[cust_id]
         print(f"\n   Customer: {name} ({cust_id})")
         for i, record in enumerate(records, 1):
             print(f"      Source {i} ({record.data_sources[0]}): {record.name or record.email or 'unknown'}")
@@ -209,41 +212,44 @@ def example_multi_source_fusion():
 
     # Merge all data sources
     print("\n📥 Merging data from all sources...")
-    customer_db.add(all_customer_records)
+    customer_db.add(list(chain.from_iterable(records_by_customer.values())))
     print(f"   Merged into {customer_db.size} unified profile(s)")
 
     # Retrieve unified profiles
     print("\n✨ Unified Customer Profiles:")
     print("-" * 80)
 
-    for cust_id in ["cust_42857", "cust_51892"]:
-        unified = customer_db.get(cust_id)
+    # Fetch each unified profile once; reused by the summary below
+    profiles = {cust_id: customer_db.get(cust_id) for cust_id in customer_names}
+    lines = []
+    for unified in profiles.values():
         if unified:
-            print(f"\n   Customer ID: {unified.customer_id}")
-            print(f"   📋 Personal Information:")
-            print(f"      Name: {unified.name}")
-            print(f"      Email: {unified.email}")
-            print(f"      Phone: {unified.phone}")
-            print(f"      Job Title: {unified.job_title}")
-
-            print(f"\n   🏢 Company Information:")
-            print(f"      Company: {unified.company}")
-
-            print(f"\n    💰 Business Metrics:")
-            print(f"      Total Spending: ${unified.total_spending:,.2f}")
-            print(f"      Support Tickets: {len(unified.support_tickets)}")
-
-            print(f"\n    📦 Product Preferences: {', '.join(unified.preferred_products)}")
-            print(f"    💬 Communication: {', '.join(unified.communication_preferences)}")
-            print(f"   📍 Data Sources: {', '.join(unified.data_sources)}")
-            print(f"   ⏱️  Last Updated: {unified.last_updated}")
+            lines.append(f"\n   Customer ID: {unified.customer_id}")
+            lines.append(f"   📋 Personal Information:")
+            lines.append(f"      Name: {unified.name}")
+            lines.append(f"      Email: {unified.email}")
+            lines.append(f"      Phone: {unified.phone}")
+            lines.append(f"      Job Title: {unified.job_title}")
+
+            lines.append(f"\n   🏢 Company Information:")
+            lines.append(f"      Company: {unified.company}")
+
+            lines.append(f"\n    💰 Business Metrics:")
+            lines.append(f"      Total Spending: ${unified.total_spending:,.2f}")
+            lines.append(f"      Support Tickets: {len(unified.support_tickets)}")
+
+            lines.append(f"\n    📦 Product Preferences: {', '.join(unified.preferred_products)}")
+            lines.append(f"    💬 Communication: {', '.join(unified.communication_preferences)}")
+            lines.append(f"   📍 Data Sources: {', '.join(unified.data_sources)}")
+            lines.append(f"   ⏱️  Last Updated: {unified.last_updated}")
+    print("\n".join(lines))
 
     # Summary statistics
     print("\n\n📈 Customer Database Summary:")
     print("-" * 80)
     print(f"   Total Customers: {customer_db.size}")
     total_spending = sum(
-        c.total_spending for c in [customer_db.get(cid) for cid in ["cust_42857", "cust_51892"]]
+        c.total_spending for c in profiles.values()
         if c and c.total_spending
     )
     print(f"   Total Combined Spending: ${total_spending:,.2f}")
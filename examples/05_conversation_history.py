@@ -13,11 +13,9 @@ Key Features:
 - Memory-aware response generation
 """
 
-import json
 from pathlib import Path
 from pydantic import BaseModel
 from dotenv import load_dotenv
-from datetime import datetime
 
 from ontomem import OMem
 
@@ -14,7 +14,7 @@ import os
 import shutil
 from dotenv import load_dotenv
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 try:
     from langchain_openai import ChatOpenAI, OpenAIEmbeddings
@@ -26,6 +26,13 @@ except ImportError:
 # Load environment variables (OPENAI_API_KEY if available)
 load_dotenv()
 
+# Cap on raw mood notes kept per day; the daily_summary carries older context,
+# so merge prompts stay bounded however long the event stream runs. Every merge
+# path validates its result against the schema, so the validator below holds the
+# cap after each merge. Older notes are dropped rather than reservoir-sampled,
+# which keeps merge results reproducible.
+MAX_MOOD_OBSERVATIONS = 50
+
 # 1. Define a schema for a "Daily User Trace"
 class DailyUserTrace(BaseModel):
     """
@@ -46,6 +53,12 @@ class DailyUserTrace(BaseModel):
         description="LLM synthesized summary of the day's behavior"
     )
 
+    @field_validator("mood_observations")
+    @classmethod
+    def keep_recent_moods(cls, moods: List[str]) -> List[str]:
+        """Keep only the most recent observations."""
+        return moods[-MAX_MOOD_OBSERVATIONS:]
+
 
 def example_temporal_consolidation():
     print("\n" + "="*70)
@@ -97,9 +110,10 @@ def example_temporal_consolidation():
     ]
 
     print(f"\n📥 Streaming {len(events_day1)} fragmented events for Alice on Jan 1st...\n")
-    for i, event in enumerate(events_day1, 1):
-        print(f"   [{i}] Pages: {event.visited_pages}, Actions: {event.actions_performed}")
-        memory.add(event)
+    print("\n".join(
+        f"   [{i}] Pages: {event.visited_pages}, Actions: {event.actions_performed}"
+        for i, event in enumerate(events_day1, 1)
+    ))
 
     print("\n" + "-"*70)
     print("📅 DAY 2: 2024-01-02 (New Context → New Record)")
@@ -113,7 +127,10 @@ def example_temporal_consolidation():
     )
     print("\n📥 Streaming event for Alice on Jan 2nd (Support issue)...\n")
     print(f"   Pages: {event_day2.visited_pages}")
-    memory.add(event_day2)
+
+    # Ingest both days in one call: OMem groups by composite key and merges
+    # Jan 1st's fragments with batched LLM calls instead of one call per event
+    memory.add(events_day1 + [event_day2])
 
     # 3. Retrieve and Show Results
     print("\n" + "="*70)
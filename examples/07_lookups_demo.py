@@ -12,7 +12,6 @@ Key Concepts:
 3. Composite Keys: Creating complex keys for specialized queries.
 """
 
-from typing import List
 from dotenv import load_dotenv
 from pydantic import BaseModel
 from ontomem import OMem, MergeStrategy
@@ -71,15 +70,19 @@ def main():
     target_char = "Aragorn"
     results = memory.get_by_lookup("by_character", target_char)
     print(f"🔍 Query 'by_character'='{target_char}': Found {len(results)} events")
-    for e in results:
-        print(f"   -> [{e.timestamp}] {e.action} at {e.location}")
+    print("\n".join(
+        f"   -> [{e.timestamp}] {e.action} at {e.location}"
+        for e in results
+    ))
 
     # Query by Location
     target_loc = "Rivendell"
     results = memory.get_by_lookup("by_location", target_loc)
     print(f"\n🔍 Query 'by_location'='{target_loc}': Found {len(results)} events")
-    for e in results:
-        print(f"   -> [{e.timestamp}] {e.char_name}: {e.action}")
+    print("\n".join(
+        f"   -> [{e.timestamp}] {e.char_name}: {e.action}"
+        for e in results
+    ))
 
     # ---------------------------------------------------------
     # Scenario 2: Data Consistency during Updates (Merge)
@@ -121,16 +124,13 @@ def main():
     print("Scenario 3: Advanced Composite Keys")
     print("-" * 40)
     # Create an index combining Time hour + Location
-    # E.g., "08:Rivendell"
-    print("Creating composite index 'time_loc' (Hour:Location)...")
-    memory.create_lookup(
-        "time_loc", 
-        lambda x: f"{x.timestamp.split(':')[0]}:{x.location}"
-    )
+    # E.g., ("08", "Rivendell"); a tuple key avoids building a string per item
+    print("Creating composite index 'time_loc' (Hour, Location)...")
+    memory.create_lookup("time_loc", lambda x: (x.timestamp[:2], x.location))
     
-    search_key = "08:Rivendell"
+    search_key = ("08", "Rivendell")
     results = memory.get_by_lookup("time_loc", search_key)
-    print(f"🔍 Composite Query '{search_key}': Found {len(results)} event(s)")
+    print(f"🔍 Composite Query {search_key}: Found {len(results)} event(s)")
     if results:
         print(f"   -> {results[0].char_name} was {results[0].action}")
 
@@ -9,7 +9,6 @@
 - 跨多个调试会话的学习
 """
 
-import json
 from pathlib import Path
 from pydantic import BaseModel
 from dotenv import load_dotenv
@@ -103,11 +102,13 @@ def example_self_improving_debugger():
     ]
 
     print("\n📋 错误遭遇日志：")
+    lines = []
     for i, encounter in enumerate(all_debug_logs, 1):
-        print(f"\n  遭遇 {i} [{encounter.error_id}]：")
-        print(f"    错误: {encounter.error_message}")
-        print(f"    提议的解决方案: {len(encounter.solutions)}个")
-        print(f"    尝试过的修复: {len(encounter.attempted_fixes)}个")
+        lines.append(f"\n  遭遇 {i} [{encounter.error_id}]：")
+        lines.append(f"    错误: {encounter.error_message}")
+        lines.append(f"    提议的解决方案: {len(encounter.solutions)}个")
+        lines.append(f"    尝试过的修复: {len(encounter.attempted_fixes)}个")
+    print("\n".join(lines))
 
     # 用智能合并初始化OMem（如果API密钥可用）
     print("\n🤖 使用智能合并初始化调试器内存...")
@@ -122,7 +123,7 @@ def example_self_improving_debugger():
 
         omem = OMem(
             memory_schema=DebugLog,
-            key_extractor=lambda x: x.error_id,
+            key_extractor="error_id",
             llm_client=llm,
             embedder=None,
             strategy_or_merger=MergeStrategy.LLM.BALANCED,
@@ -131,7 +132,7 @@ def example_self_improving_debugger():
         print(f"   ⚠️  LLM不可用 ({type(e).__name__}) - 改用字段合并")
         omem = OMem(
             memory_schema=DebugLog,
-            key_extractor=lambda x: x.error_id,
+            key_extractor="error_id",
             llm_client=None,
             embedder=None,
             strategy_or_merger=MergeStrategy.MERGE_FIELD,
@@ -152,11 +153,15 @@ def example_self_improving_debugger():
             print(f"   错误消息: {consolidated.error_message}")
             print(f"   根本原因: {consolidated.root_cause or '从多个遭遇推断'}")
             print(f"\n   📌 所有找到的解决方案：")
-            for j, solution in enumerate(consolidated.solutions, 1):
-                print(f"      {j}. {solution}")
+            print("\n".join(
+                f"      {j}. {solution}"
+                for j, solution in enumerate(consolidated.solutions, 1)
+            ))
             print(f"\n   ✓ 尝试过的修复：")
-            for j, fix in enumerate(consolidated.attempted_fixes, 1):
-                print(f"      {j}. {fix}")
+            print("\n".join(
+                f"      {j}. {fix}"
+                for j, fix in enumerate(consolidated.attempted_fixes, 1)
+            ))
 
     # 持久化到temp目录
     temp_dir = Path(__file__).parent.parent.parent / "temp"
@@ -173,7 +178,7 @@ def example_self_improving_debugger():
     
     omem_restored = OMem(
         memory_schema=DebugLog,
-        key_extractor=lambda x: x.error_id,
+        key_extractor="error_id",
         llm_client=None,
         embedder=None,
         strategy_or_merger=MergeStrategy.MERGE_FIELD,
@@ -9,9 +9,7 @@
 - 渐进式的NPC意见和行为更新
 """
 
-import json
 from pathlib import Path
-from typing import Literal
 from pydantic import BaseModel
 
 from ontomem import OMem
@@ -109,16 +107,18 @@ def example_rpg_npc_memory():
     print(f"\n🎮 NPC：{npc_name}")
     print(f"📝 与{len({m.player_id for m in all_encounter_memories})}个不同玩家的遭遇：\n")
 
+    lines = []
     for i, memory in enumerate(all_encounter_memories, 1):
-        print(f"  ⚔️  遭遇 {i} [玩家：{memory.player_id}]：")
-        print(f"     玩家名字：{memory.player_name or '（未知）'}")
-        print(
+        lines.append(f"  ⚔️  遭遇 {i} [玩家：{memory.player_id}]：")
+        lines.append(f"     玩家名字：{memory.player_name or '（未知）'}")
+        lines.append(
             f"     获得的头衔：{', '.join(memory.titles_earned) or '（暂无）'}"
         )
-        print(
+        lines.append(
             f"     声望事件：{len(memory.reputation_events)}个事件"
         )
-        print(f"     已知技能：{', '.join(memory.known_skills) or '（未知）'}")
+        lines.append(f"     已知技能：{', '.join(memory.known_skills) or '（未知）'}")
+    print("\n".join(lines))
 
     # 使用MERGE_FIELD策略初始化NPC记忆
     print("\n🧠 构建NPC的综合记忆...")
@@ -126,7 +126,7 @@ def example_rpg_npc_memory():
     
     npc_memory = OMem(
         memory_schema=NPCMemory,
-        key_extractor=lambda x: x.player_id,
+        key_extractor="player_id",
         llm_client=None,
         embedder=None,
         strategy_or_merger=MergeStrategy.MERGE_FIELD,
@@ -140,18 +140,20 @@ def example_rpg_npc_memory():
     print("\n🔍 NPC的完整记忆档案：")
     print("-" * 80)
 
+    lines = []
     for player_id in ["hero_001", "hero_002"]:
         player_profile = npc_memory.get(player_id)
         if player_profile:
-            print(f"\n   📖 玩家ID：{player_profile.player_id}")
-            print(f"      称呼：{player_profile.player_name}")
-            print(f"      📜 获得的头衔：{', '.join(player_profile.titles_earned) or '（无）'}")
-            print(f"      🎖️  声望事件：{len(player_profile.reputation_events)}个事件")
-            print(f"      ⚔️  已知技能：{', '.join(player_profile.known_skills) or '（未知）'}")
-            print(f"      💰 贸易历史：{len(player_profile.trade_history)}笔交易")
-            print(f"      📍 地点：首次在{player_profile.first_meeting_location}见面，最后在{player_profile.last_known_location}看到")
-            print(f"      💭 意见：{player_profile.npc_opinion or '（正在形成...）'}")
-            print(f"      💞 关系：{player_profile.party_relationship or '（中立）'}")
+            lines.append(f"\n   📖 玩家ID：{player_profile.player_id}")
+            lines.append(f"      称呼：{player_profile.player_name}")
+            lines.append(f"      📜 获得的头衔：{', '.join(player_profile.titles_earned) or '（无）'}")
+            lines.append(f"      🎖️  声望事件：{len(player_profile.reputation_events)}个事件")
+            lines.append(f"      ⚔️  已知技能：{', '.join(player_profile.known_skills) or '（未知）'}")
+            lines.append(f"      💰 贸易历史：{len(player_profile.trade_history)}笔交易")
+            lines.append(f"      📍 地点：首次在{player_profile.first_meeting_location}见面，最后在{player_profile.last_known_location}看到")
+            lines.append(f"      💭 意见：{player_profile.npc_opinion or '（正在形成...）'}")
+            lines.append(f"      💞 关系：{player_profile.party_relationship or '（中立）'}")
+    print("\n".join(lines))
 
     # 将NPC记忆保存到文件
     temp_dir = Path(__file__).parent.parent / "temp"
@@ -11,8 +11,9 @@
 - 批量索引和搜索操作
 """
 
-import json
+from collections import Counter, defaultdict
 from pathlib import Path
+import numpy as np
 from pydantic import BaseModel
 from dotenv import load_dotenv
 
@@ -153,12 +154,16 @@ def example_semantic_scholar():
 
     print("\n📚 加载研究论文：")
     print("\n   📝 自然语言处理研究方向：")
-    for paper in nlp_papers:
-        print(f"      [{paper.paper_id}] {paper.title} ({paper.year})")
+    print("\n".join(
+        f"      [{paper.paper_id}] {paper.title} ({paper.year})"
+        for paper in nlp_papers
+    ))
 
     print("\n   🖼️  计算机视觉方向：")
-    for paper in cv_papers:
-        print(f"      [{paper.paper_id}] {paper.title} ({paper.year})")
+    print("\n".join(
+        f"      [{paper.paper_id}] {paper.title} ({paper.year})"
+        for paper in cv_papers
+    ))
 
     # 初始化OMem
     print("\n🔧 正在初始化论文库...")
@@ -166,14 +171,13 @@ def example_semantic_scholar():
     
     try:
         from langchain_openai import OpenAIEmbeddings
-        from langchain_community.vectorstores import FAISS
 
         embedder = OpenAIEmbeddings(model="text-embedding-3-small")
         print("   ✅ 找到了OpenAI API密钥 - 已启用向量搜索")
 
         library = OMem(
             memory_schema=ResearchPaper,
-            key_extractor=lambda x: x.paper_id,
+            key_extractor="paper_id",
             llm_client=None,
             embedder=embedder,
             strategy_or_merger=MergeStrategy.MERGE_FIELD,
@@ -182,7 +186,7 @@ def example_semantic_scholar():
         print(f"   ⚠️  OpenAI不可用 - 仅使用关键字搜索")
         library = OMem(
             memory_schema=ResearchPaper,
-            key_extractor=lambda x: x.paper_id,
+            key_extractor="paper_id",
             llm_client=None,
             embedder=None,
             strategy_or_merger=MergeStrategy.MERGE_FIELD,
@@ -215,6 +219,13 @@ def example_semantic_scholar():
         "视觉图像识别",
         "自监督学习",
     ]
+    # 关键字搜索后备使用的倒排索引：小写关键字 -> 带有该关键字的论文位置。
+    # 只构建一次；查询按每种关键字长度查找自身的子串，而不是扫描所有关键字
+    papers_by_keyword = defaultdict(set)
+    for pos, p in enumerate(all_papers):
+        for kw in p.keywords:
+            papers_by_keyword[kw.lower()].add(pos)
+    keyword_lengths = sorted({len(kw) for kw in papers_by_keyword})
 
     for query in search_queries:
         print(f"\n   查询：'{query}'")
@@ -230,11 +241,12 @@ def example_semantic_scholar():
                 print("   （语义搜索需要OpenAI API密钥）")
         except Exception:
             # 后备：关键字搜索
-            matching = [
-                p
-                for p in all_papers
-                if any(kw.lower() in query.lower() for kw in p.keywords)
-            ]
+            query_lower = query.lower()
+            positions = set()
+            for n in keyword_lengths:
+                for start in range(len(query_lower) - n + 1):
+                    positions |= papers_by_keyword.get(query_lower[start:start + n], set())
+            matching = [all_papers[pos] for pos in sorted(positions)]
             if matching:
                 print("   结果（按关键字匹配）：")
                 for i, p in enumerate(matching[:2], 1):
@@ -252,29 +264,30 @@ def example_semantic_scholar():
     # 统计数据
     print("\n📊 库的统计数据：")
     print("-" * 80)
-    total_citations = sum(p.citations for p in all_papers)
-    avg_year = sum(p.year for p in all_papers) / len(all_papers)
-    all_keywords = set()
-    for p in all_papers:
-        all_keywords.update(p.keywords)
+    # 一次调用构建（引用数, 年份）矩阵；all_papers 由 nlp_papers 和 cv_papers 依次拼接而成
+    stats = np.array(
+        [(p.citations, p.year) for p in all_papers], dtype=np.int64
+    ).reshape(-1, 2)
+    keyword_freq = Counter(kw for p in all_papers for kw in p.keywords)
+    citations, years = stats[:, 0], stats[:, 1]
+    num_nlp = len(nlp_papers)
+    total_citations = int(citations.sum())
+    avg_year = float(years.mean())
 
     print(f"   论文总数：{len(all_papers)}")
-    print(f"      • 自然语言处理研究：{len(nlp_papers)}篇论文（{sum(p.citations for p in nlp_papers):,}次引用）")
-    print(f"      • 计算机视觉：{len(cv_papers)}篇论文（{sum(p.citations for p in cv_papers):,}次引用）")
+    print(f"      • 自然语言处理研究：{len(nlp_papers)}篇论文（{int(citations[:num_nlp].sum()):,}次引用）")
+    print(f"      • 计算机视觉：{len(cv_papers)}篇论文（{int(citations[num_nlp:].sum()):,}次引用）")
     print(f"\n   总引用数：{total_citations:,}")
     print(f"   平均发表年份：{avg_year:.0f}")
-    print(f"   独特关键字：{len(all_keywords)}")
-    print(f"   最被引用的论文：{max(all_papers, key=lambda p: p.citations).title}")
+    print(f"   独特关键字：{len(keyword_freq)}")
+    print(f"   最被引用的论文：{all_papers[int(citations.argmax())].title}")
 
     # 显示热门关键字
-    keyword_freq = {}
-    for p in all_papers:
-        for kw in p.keywords:
-            keyword_freq[kw] = keyword_freq.get(kw, 0) + 1
-
     print(f"\n   热门关键字（跨所有方向）：")
-    for kw, freq in sorted(keyword_freq.items(), key=lambda x: -x[1])[:5]:
-        print(f"      • {kw}：{freq}篇论文")
+    print("\n".join(
+        f"      • {kw}：{freq}篇论文"
+        for kw, freq in keyword_freq.most_common(5)
+    ))
 
     print("\n" + "=" * 80)
     print("✨ 研究论文库已准备好进行探索！")
@@ -11,11 +11,11 @@
 - 通过源跟踪维护数据谱系
 """
 
-import json
+from collections import defaultdict
+from itertools import chain
 from pathlib import Path
 from pydantic import BaseModel
 from dotenv import load_dotenv
-from datetime import datetime
 
 from ontomem import OMem
 
@@ -169,13 +169,16 @@ def example_multi_source_fusion():
     print("\n📊 来自多个源的数据（2个客户）：")
     print("-" * 80)
 
-    # 按客户分组
-    customers_data = {
-        "cust_42857": ("莎拉·约翰逊", [r for r in all_customer_records if r.customer_id == "cust_42857"]),
-        "cust_51892": ("迈克尔·陈", [r for r in all_customer_records if r.customer_id == "cust_51892"]),
-    }
+    # 一次遍历按客户分桶；按时间从旧到新排序，使合并时较新的数据后到
+    records_by_customer = defaultdict(list)
+    for record in all_customer_records:
+        records_by_customer[record.customer_id].append(record)
+    for records in records_by_customer.values():
+        records.sort(key=lambda r: r.last_updated or "")
+    customer_names = {"cust_42857": "莎拉·约翰逊", "cust_51892": "迈克尔·陈"}
 
-    for cust_id, (name, records) in customers_data.items():
+    for cust_id, records in records_by_customer.items():
+        name = customer_names[cust_id]
         print(f"\n   客户：{name}（{cust_id}）")
         for i, record in enumerate(records, 1):
             print(f"      源 {i}（{record.data_sources[0]}）：{record.name or record.email or '未知'}")
@@ -209,41 +212,44 @@ def example_multi_source_fusion():
 
     # 合并所有数据源
     print("\n📥 正在从所有源合并数据...")
-    customer_db.add(all_customer_records)
+    customer_db.add(list(chain.from_iterable(records_by_customer.values())))
     print(f"   已整合为{customer_db.size}个统一档案")
 
     # 检索统一档案
     print("\n✨ 统一的客户档案：")
     print("-" * 80)
 
-    for cust_id in ["cust_42857", "cust_51892"]:
-        unified = customer_db.get(cust_id)
+    # 每个统一档案只获取一次，下方汇总中复用
+    profiles = {cust_id: customer_db.get(cust_id) for cust_id in customer_names}
+    lines = []
+    for unified in profiles.values():
         if unified:
-            print(f"\n   客户ID：{unified.customer_id}")
-            print(f"   📋 个人信息：")
-            print(f"      名字：{unified.name}")
-            print(f"      电子邮件：{unified.email}")
-            print(f"      电话：{unified.phone}")
-            print(f"      职位：{unified.job_title}")
-
-            print(f"\n   🏢 公司信息：")
-            print(f"      公司：{unified.company}")
-
-            print(f"\n    💰 商业指标：")
-            print(f"      总消费：${unified.total_spending:,.2f}")
-            print(f"      支持工单：{len(unified.support_tickets)}")
-
-            print(f"\n    📦 产品偏好：{', '.join(unified.preferred_products)}")
-            print(f"    💬 通信方式：{', '.join(unified.communication_preferences)}")
-            print(f"   📍 数据源：{', '.join(unified.data_sources)}")
-            print(f"   ⏱️  最后更新：{unified.last_updated}")
+            lines.append(f"\n   客户ID：{unified.customer_id}")
+            lines.append(f"   📋 个人信息：")
+            lines.append(f"      名字：{unified.name}")
+            lines.append(f"      电子邮件：{unified.email}")
+            lines.append(f"      电话：{unified.phone}")
+            lines.append(f"      职位：{unified.job_title}")
+
+            lines.append(f"\n   🏢 公司信息：")
+            lines.append(f"      公司：{unified.company}")
+
+            lines.append(f"\n    💰 商业指标：")
+            lines.append(f"      总消费：${unified.total_spending:,.2f}")
+            lines.append(f"      支持工单：{len(unified.support_tickets)}")
+
+            lines.append(f"\n    📦 产品偏好：{', '.join(unified.preferred_products)}")
+            lines.append(f"    💬 通信方式：{', '.join(unified.communication_preferences)}")
+            lines.append(f"   📍 数据源：{', '.join(unified.data_sources)}")
+            lines.append(f"   ⏱️  最后更新：{unified.last_updated}")
+    print("\n".join(lines))
 
     # 摘要统计
     print("\n\n📈 客户数据库摘要：")
     print("-" * 80)
     print(f"   客户总数：{customer_db.size}")
     total_spending = sum(
-        c.total_spending for c in [customer_db.get(cid) for cid in ["cust_42857", "cust_51892"]]
+        c.total_spending for c in profiles.values()
         if c and c.total_spending
     )
     print(f"   总消费：${total_spending:,.2f}")
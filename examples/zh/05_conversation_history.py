@@ -12,11 +12,9 @@
 - 记忆感知响应生成
 """
 
-import json
 from pathlib import Path
 from pydantic import BaseModel
 from dotenv import load_dotenv
-from datetime import datetime
 
 from ontomem import OMem
 
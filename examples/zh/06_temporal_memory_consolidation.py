@@ -13,7 +13,7 @@ import os
 import shutil
 from dotenv import load_dotenv
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 try:
     from langchain_openai import ChatOpenAI, OpenAIEmbeddings
@@ -26,6 +26,12 @@ except ImportError:
 # 加载环境变量（如果可用则加载OPENAI_API_KEY）
 load_dotenv()
 
+# 每天保留的原始情绪记录上限；更早的上下文由 daily_summary 承载，
+# 因此无论事件流多长，合并提示词的大小都保持有界。所有合并路径都会按模式
+# 校验结果，因此下面的校验器在每次合并后都能保证上限。更早的记录直接丢弃
+# 而不做蓄水池抽样，以保证合并结果可复现。
+MAX_MOOD_OBSERVATIONS = 50
+
 # 1. 定义"每日用户轨迹"的模式
 class DailyUserTrace(BaseModel):
     """
@@ -46,6 +52,12 @@ class DailyUserTrace(BaseModel):
         description="LLM 综合生成的当日行为摘要"
     )
 
+    @field_validator("mood_observations")
+    @classmethod
+    def keep_recent_moods(cls, moods: List[str]) -> List[str]:
+        """只保留最近的情绪记录。"""
+        return moods[-MAX_MOOD_OBSERVATIONS:]
+
 
 def example_temporal_consolidation():
     print("\n" + "="*70)
@@ -97,9 +109,10 @@ def example_temporal_consolidation():
     ]
 
     print(f"\n📥 为 Alice 流式写入 1月1日 的 {len(events_day1)} 个碎片事件...\n")
-    for i, event in enumerate(events_day1, 1):
-        print(f"   [{i}] 页面: {event.visited_pages}, 动作: {event.actions_performed}")
-        memory.add(event)
+    print("\n".join(
+        f"   [{i}] 页面: {event.visited_pages}, 动作: {event.actions_performed}"
+        for i, event in enumerate(events_day1, 1)
+    ))
 
     print("\n" + "-"*70)
     print("📅 第 2 天：2024-01-02 (新上下文 → 新记录)")
@@ -113,7 +126,10 @@ def example_temporal_consolidation():
     )
     print("\n📥 为 Alice 写入 1月2日 的事件 (售后问题)...\n")
     print(f"   页面: {event_day2.visited_pages}")
-    memory.add(event_day2)
+
+    # 一次性写入两天的事件：OMem 按复合键分组，
+    # 并通过批量 LLM 调用整合 1月1日 的碎片，而不是每个事件调用一次
+    memory.add(events_day1 + [event_day2])
 
     # 3. 检索并展示结果
     print("\n" + "="*70)
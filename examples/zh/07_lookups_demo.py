@@ -12,7 +12,6 @@
 3. 复合键：创建复杂的键以进行特定查询。
 """
 
-from typing import List
 from pydantic import BaseModel
 from ontomem import OMem, MergeStrategy
 
@@ -67,15 +66,19 @@ def main():
     target_char = "亚拉贡"
     results = memory.get_by_lookup("by_character", target_char)
     print(f"🔍 查询 'by_character'='{target_char}': 找到 {len(results)} 条事件")
-    for e in results:
-        print(f"   -> [{e.timestamp}] 在 {e.location} {e.action}")
+    print("\n".join(
+        f"   -> [{e.timestamp}] 在 {e.location} {e.action}"
+        for e in results
+    ))
 
     # 按地点查询
     target_loc = "瑞文戴尔"
     results = memory.get_by_lookup("by_location", target_loc)
     print(f"\n🔍 查询 'by_location'='{target_loc}': 找到 {len(results)} 条事件")
-    for e in results:
-        print(f"   -> [{e.timestamp}] {e.char_name}: {e.action}")
+    print("\n".join(
+        f"   -> [{e.timestamp}] {e.char_name}: {e.action}"
+        for e in results
+    ))
 
     # ---------------------------------------------------------
     # 场景 2: 数据更新时的一致性 (Merge)
@@ -117,16 +120,13 @@ def main():
     print("场景 3: 高级复合键查询")
     print("-" * 40)
     # 创建一个结合了 时间(小时) + 地点 的索引
-    # 例如: "08:瑞文戴尔"
-    print("正在创建复合索引 'time_loc' (小时:地点)...")
-    memory.create_lookup(
-        "time_loc", 
-        lambda x: f"{x.timestamp.split(':')[0]}:{x.location}"
-    )
+    # 例如: ("08", "瑞文戴尔")；元组键无需为每个条目拼接字符串
+    print("正在创建复合索引 'time_loc' (小时, 地点)...")
+    memory.create_lookup("time_loc", lambda x: (x.timestamp[:2], x.location))
     
-    search_key = "08:瑞文戴尔"
+    search_key = ("08", "瑞文戴尔")
     results = memory.get_by_lookup("time_loc", search_key)
-    print(f"🔍 复合查询 '{search_key}': 找到 {len(results)} 条事件")
+    print(f"🔍 复合查询 {search_key}: 找到 {len(results)} 条事件")
     if results:
         print(f"   -> {results[0].char_name} 正在 {results[0].action}")
 
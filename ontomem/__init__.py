@@ -6,6 +6,7 @@ with automatic deduplication, merging, and vector-based search.
 
 from .core.omem import OMem
 from .core.base import BaseMem
+from .core.faiss_index import IndexType
 from .merger import (
     MergeStrategy,
     BaseMerger,
@@ -39,6 +40,7 @@ __all__ = [
     "PreferIncomingMerger",
     # Types
     "MergeStrategy",
+    "IndexType",
     # Utilities
     "configure_logging",
     "get_logger",
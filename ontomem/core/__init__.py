@@ -1,5 +1,6 @@
 """Core memory abstraction and utilities."""
 
 from .base import BaseMem
+from .faiss_index import IndexType
 
-__all__ = ["BaseMem"]
+__all__ = ["BaseMem", "IndexType"]
@@ -1,8 +1,9 @@
 """BaseMem - Abstract base class for memory stores."""
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Generic, List, Optional, TypeVar, Union
+from typing import Any, Generic, Iterator, List, Optional, TypeVar, Union
 
 from pydantic import BaseModel
 
@@ -37,6 +38,33 @@ class BaseMem(ABC, Generic[T]):
         """Return the number of entities in memory."""
         pass
 
+    # --- Container Protocol ---
+    # Defaults built on the abstract accessors; implementations may override
+    # them to hit their backing storage directly.
+
+    def __len__(self) -> int:
+        """Return the number of entities in memory (`len(memory)`)."""
+        return self.size
+
+    def __contains__(self, key: Any) -> bool:
+        """Check whether an entity is stored under key (`key in memory`)."""
+        return self.get(key) is not None
+
+    def __getitem__(self, key: Any) -> T:
+        """Retrieve an entity by key (`memory[key]`).
+
+        Raises:
+            KeyError: If no entity is stored under key.
+        """
+        item = self.get(key)
+        if item is None:
+            raise KeyError(key)
+        return item
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the keys in memory (`for key in memory`)."""
+        return iter(self.keys)
+
     def empty(self) -> bool:
         """Check if memory is empty.
 
@@ -89,6 +117,21 @@ class BaseMem(ABC, Generic[T]):
         """Semantic search over memory."""
         pass
 
+    def search_batch(self, queries: List[str], top_k: int = 5) -> List[List[T]]:
+        """Semantic search for several queries.
+
+        The default runs `search()` per query; implementations backed by a
+        vector index can override it to search all queries in one pass.
+
+        Args:
+            queries: Natural language query strings.
+            top_k: Number of results to return per query. Default: 5.
+
+        Returns:
+            One list of entities per query, each ranked by similarity.
+        """
+        return [self.search(query, top_k=top_k) for query in queries]
+
     # --- Fine-grained Persistence (v0.1.5+) ---
 
     @abstractmethod
@@ -155,15 +198,25 @@ class BaseMem(ABC, Generic[T]):
             2. Metadata - metadata.json
             3. Vector index - faiss_index/ subfolder (if built)
 
+        The three parts go to disjoint files and only read the entities, so
+        they are written concurrently: serializing the data overlaps with any
+        pending re-embedding and with FAISS writing the index. Each part is
+        replaced atomically on its own, but not the three together.
+
         Args:
             folder_path: Base directory path to save memory data.
         """
         folder_path = Path(folder_path)
         folder_path.mkdir(parents=True, exist_ok=True)
 
-        self.dump_data(folder_path / "memory.json")
-        self.dump_metadata(folder_path / "metadata.json")
-        self.dump_index(folder_path / "faiss_index")
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(self.dump_data, folder_path / "memory.json"),
+                executor.submit(self.dump_metadata, folder_path / "metadata.json"),
+                executor.submit(self.dump_index, folder_path / "faiss_index"),
+            ]
+        for future in futures:
+            future.result()
 
     def load(self, folder_path: Union[str, Path]) -> None:
         """Load memory state from disk (data + metadata + index).
@@ -173,6 +226,9 @@ class BaseMem(ABC, Generic[T]):
             2. Metadata - metadata.json
             3. Vector index - faiss_index/ subfolder (if available)
 
+        The parts are loaded in order, since loading data adds (and may merge)
+        entities that the loaded index then refers to.
+
         Args:
             folder_path: Base directory path to load memory data from.
         """
@@ -4,23 +4,55 @@ A stateful, self-consolidating semantic memory store built on Pydantic schemas,
 with intelligent deduplication, merging strategies, and Faiss-based vector search.
 """
 
+import functools
+import hashlib
 import json
+import operator
+import uuid
 from pathlib import Path
-from typing import Any, Callable, Dict, Generic, List, Optional, Set, Type, Union
+from typing import (
+    TYPE_CHECKING, Any, Callable, Dict, Generic, Iterator, List, Optional, Sequence, Set,
+    Tuple, Type, Union,
+)
 
-from pydantic import BaseModel
-from langchain_core.documents import Document
-from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_core.embeddings import Embeddings
+import faiss
+import numpy as np
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import PydanticSerializationError
 
 from .base import BaseMem, T
-from ..merger import BaseMerger, create_merger, MergeStrategy
+from .faiss_index import IndexType, built_index_type, create_faiss_index
+from ..merger import BaseLLMMerger, BaseMerger, create_merger, MergeStrategy
+from ..utils.io import staged_folder, write_bytes_atomic
 from ..utils.logging import configure_logging, get_logger
 
-from langchain_community.vectorstores import FAISS
+# LangChain modules are slow to import; the FAISS wrapper and Document are
+# imported on first index use, the rest only for type checking.
+if TYPE_CHECKING:
+    from langchain_core.embeddings import Embeddings
+    from langchain_core.language_models.chat_models import BaseChatModel
+    from langchain_community.vectorstores import FAISS
 
 logger = get_logger(__name__)
 
+# Recent query embeddings kept per OMem, so repeated searches skip the embedder
+QUERY_EMBEDDING_CACHE_SIZE = 128
+
+
+@functools.lru_cache(maxsize=None)
+def _list_adapter_for(memory_schema: Type[T]) -> TypeAdapter:
+    """Build (once per schema class) a TypeAdapter for lists of entities."""
+    return TypeAdapter(List[memory_schema])
+
+
+def _same_lookup_key(extractor: Callable[[Any], Any], old_item: Any, new_item: Any) -> bool:
+    """Whether a lookup extractor maps both items to the same (valid) key."""
+    try:
+        old_val = extractor(old_item)
+        return old_val is not None and old_val == extractor(new_item)
+    except Exception:
+        return False
+
 
 class OMem(BaseMem[T], Generic[T]):
     """Stateful Ontology Memory Store.
@@ -78,14 +110,15 @@ class OMem(BaseMem[T], Generic[T]):
     def __init__(
         self,
         memory_schema: Type[T],
-        key_extractor: Callable[[T], Any],
-        llm_client: BaseChatModel,
-        embedder: Embeddings,
+        key_extractor: Union[str, Sequence[str], Callable[[T], Any]],
+        llm_client: "BaseChatModel",
+        embedder: "Embeddings",
         *,
         strategy_or_merger: Union[
             MergeStrategy, BaseMerger
         ] = MergeStrategy.LLM.BALANCED,
         fields_for_index: Optional[List[str]] = None,
+        index_type: Union[IndexType, str] = IndexType.FLAT,
         verbose: bool = False,
         **kwargs: Any,
     ):
@@ -93,8 +126,11 @@ class OMem(BaseMem[T], Generic[T]):
 
         Args:
             memory_schema: The Pydantic model class defining the entity structure.
-            key_extractor: Function to extract unique ID from an entity.
-                           e.g., `lambda x: x.uid` or `lambda x: x.id`
+            key_extractor: Function to extract unique ID from an entity,
+                           e.g., `lambda x: x.uid`, or the name of the key field,
+                           e.g., `"uid"` (resolved to a faster `operator.attrgetter`).
+                           A list of names, e.g. `["org", "uid"]`, keys by the
+                           tuple of those field values.
             llm_client: LangChain ChatModel instance for merging strategies.
             embedder: LangChain Embeddings instance for semantic search.
             strategy_or_merger: Merge strategy definition. Can be:
@@ -102,6 +138,9 @@ class OMem(BaseMem[T], Generic[T]):
                                 2. A pre-configured BaseMerger instance (for full control)
             fields_for_index: (Optional) List of field names to embed for search.
                                If None, entire JSON is embedded.
+            index_type: FAISS index family for semantic search (IndexType.FLAT,
+                        FLAT_FP16, FLAT_INT8, HNSW, IVF_FLAT, IVF_PQ, BINARY or
+                        AUTO). Default FLAT gives exact results.
             verbose: Enable DEBUG logging. Default False uses WARNING level (quiet mode).
             **kwargs: Additional arguments passed to create_merger() when strategy_or_merger is
                       a MergeStrategy enum. For example, rule="..." and dynamic_rule=... for
@@ -113,10 +152,15 @@ class OMem(BaseMem[T], Generic[T]):
             configure_logging(level="WARNING")
 
         self.memory_schema = memory_schema
+        key_extractor = self._resolve_extractor(key_extractor)
+        # Validates/serializes whole lists of entities in a single pydantic-core call;
+        # shared across OMem instances with the same schema to skip the schema build
+        self._list_adapter = _list_adapter_for(memory_schema)
         self.key_extractor = key_extractor
         self.llm_client = llm_client
         self.embedder = embedder
         self.fields_for_index = fields_for_index or []
+        self.index_type = IndexType(index_type)
 
         if self.fields_for_index:
             for field in self.fields_for_index:
@@ -154,7 +198,17 @@ class OMem(BaseMem[T], Generic[T]):
         self._lookup_extractors: Dict[str, Callable[[T], Any]] = {}
 
         # 4. Vector Index State (LangChain FAISS wrapper)
-        self._index: Optional[FAISS] = None  # FAISS vector store
+        # Invariant: all stored vectors and query vectors are L2-normalized, so the
+        # inner-product index ranks by cosine similarity.
+        self._index: Optional["FAISS"] = None  # FAISS vector store
+        # Structure: {primary_key: docstore_id}
+        self._doc_ids: Dict[Any, str] = {}
+        # Keys whose vectors are out of date; re-embedded in one batch before next search
+        self._stale_keys: Set[Any] = set()
+        # Normalized query vectors by query text (an embedder call is usually a network round trip)
+        self._query_vector = functools.lru_cache(maxsize=QUERY_EMBEDDING_CACHE_SIZE)(
+            self._embed_query
+        )
 
         logger.debug(
             "omem_initialized",
@@ -179,6 +233,26 @@ class OMem(BaseMem[T], Generic[T]):
         """Return the number of entities in memory."""
         return len(self._storage)
 
+    def __len__(self) -> int:
+        """Return the number of entities in memory (`len(memory)`)."""
+        return len(self._storage)
+
+    def __contains__(self, key: Any) -> bool:
+        """Check whether an entity is stored under key (`key in memory`)."""
+        return key in self._storage
+
+    def __getitem__(self, key: Any) -> T:
+        """Retrieve an entity by key (`memory[key]`).
+
+        Raises:
+            KeyError: If no entity is stored under key.
+        """
+        return self._storage[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the keys in memory (`for key in memory`)."""
+        return iter(self._storage)
+
     def has_index(self) -> bool:
         """Check if vector index is currently built.
 
@@ -189,22 +263,30 @@ class OMem(BaseMem[T], Generic[T]):
 
     # --- Lookups (Secondary Indices) ---
 
-    def create_lookup(self, name: str, key_extractor: Callable[[T], Any]) -> None:
+    def create_lookup(
+        self, name: str, key_extractor: Union[str, Sequence[str], Callable[[T], Any]]
+    ) -> None:
         """Create a secondary lookup table for fast retrieval by custom key.
 
         Example:
             >>> memory.create_lookup('by_name', lambda x: x.name)
             >>> results = memory.get_by_lookup('by_name', 'Alice')
+            >>> memory.create_lookup('by_place', ['city', 'street'])
+            >>> results = memory.get_by_lookup('by_place', ('Paris', 'Rue Cler'))
 
         Args:
             name: Unique name for this lookup (e.g., 'by_name', 'by_location').
-            key_extractor: Function to extract the lookup key from an entity.
+            key_extractor: Function to extract the lookup key from an entity,
+                           the name of the field to look up by, or a list of
+                           field names whose values form a tuple key.
 
         Raises:
-            ValueError: If lookup with this name already exists.
+            ValueError: If lookup with this name already exists, or the field
+                        name is not in memory_schema.
         """
         if name in self._lookups:
             raise ValueError(f"Lookup '{name}' already exists. Use drop_lookup() to remove it first.")
+        key_extractor = self._resolve_extractor(key_extractor)
 
         self._lookups[name] = {}
         self._lookup_extractors[name] = key_extractor
@@ -321,21 +403,25 @@ class OMem(BaseMem[T], Generic[T]):
         except Exception as e:
             logger.warning("lookup_remove_failed", lookup_name=lookup_name, pk=pk, error=str(e))
 
-    def _update_all_lookups(self, pk: Any, new_item: T, old_item: Optional[T] = None) -> None:
-        """Update all lookups for a given primary key.
+    def _update_all_lookups(self, updates: Dict[Any, Tuple[T, Optional[T]]]) -> None:
+        """Update all lookups for a batch of primary keys.
 
         Args:
-            pk: Primary key of the item.
-            new_item: The new item state.
-            old_item: The old item state (optional, for removal during updates).
+            updates: Mapping of primary key to (new_item, old_item). old_item is
+                     None for fresh inserts; otherwise its trace is removed first.
         """
         for name in self._lookups:
-            # 1. If we have the old item, remove its trace from this lookup
-            if old_item:
-                self._remove_from_lookup(name, pk, old_item)
-
-            # 2. Add the new trace
-            self._add_to_lookup(name, pk, new_item)
+            extractor = self._lookup_extractors[name]
+            for pk, (new_item, old_item) in updates.items():
+                # 1. If we have the old item, remove its trace from this lookup,
+                #    unless the merge left its lookup key unchanged
+                if old_item is not None:
+                    if _same_lookup_key(extractor, old_item, new_item):
+                        continue
+                    self._remove_from_lookup(name, pk, old_item)
+
+                # 2. Add the new trace
+                self._add_to_lookup(name, pk, new_item)
 
     # --- CRUD Operations ---
 
@@ -368,56 +454,50 @@ class OMem(BaseMem[T], Generic[T]):
         # Group incoming items by key
         key_to_items: Dict[Any, List[T]] = {}
         for item in items:
-            key = self.key_extractor(item)
-            if key not in key_to_items:
-                key_to_items[key] = []
-            key_to_items[key].append(item)
+            key_to_items.setdefault(self.key_extractor(item), []).append(item)
+
+        # Drop exact duplicates before they reach the LLM merger (cheaper
+        # mergers handle them faster than hashing them would)
+        if isinstance(self._merger, BaseLLMMerger):
+            key_to_items = self._exact_dedup(key_to_items)
 
-        # Partition: direct insert vs merge candidates
-        to_insert: List[T] = []
+        # Partition: direct insert vs merge candidates (keys are already known,
+        # so the extractor is not re-run per item)
+        to_insert: Dict[Any, T] = {}
         to_merge: List[T] = []
+        # Snapshot old items before merge for lookup cleanup
+        old_items_map: Dict[Any, T] = {}
 
         for key, new_items in key_to_items.items():
             if len(new_items) == 1 and key not in self._storage:
                 # Single new item with no conflict: direct insert
-                to_insert.append(new_items[0])
+                to_insert[key] = new_items[0]
             else:
                 # Multiple items with same key or key exists: merge
                 if key in self._storage:
+                    old_items_map[key] = self._storage[key]
                     to_merge.append(self._storage[key])
                 to_merge.extend(new_items)
 
-        # Batch merge
+        # Batch merge (one merger call for every conflicting key)
+        merged_dict: Dict[Any, T] = {}
         if to_merge:
-            # Snapshot old items before merge for lookup cleanup
-            items_to_update_keys = set()
-            old_items_map: Dict[Any, T] = {}
-
-            for item in to_merge:
-                pk = self.key_extractor(item)
-                if pk in self._storage:
-                    items_to_update_keys.add(pk)
-                    old_items_map[pk] = self._storage[pk]
-
             merged_items = self._merger.merge(to_merge)
             merged_dict = {self.key_extractor(item): item for item in merged_items}
             self._storage.update(merged_dict)
 
-            # Update lookups for merged items
-            for pk, new_item in merged_dict.items():
-                old_item = old_items_map.get(pk)
-                self._update_all_lookups(pk, new_item, old_item)
-
         # Direct insert
-        for item in to_insert:
-            pk = self.key_extractor(item)
-            self._storage[pk] = item
-            # Update lookups (no old item, only add)
-            self._update_all_lookups(pk, item, old_item=None)
+        self._storage.update(to_insert)
 
-        # Mark index as stale
+        # Update lookups in one pass (inserts have no old item to remove)
+        if self._lookups:
+            updates = {pk: (item, old_items_map.get(pk)) for pk, item in merged_dict.items()}
+            updates.update({pk: (item, None) for pk, item in to_insert.items()})
+            self._update_all_lookups(updates)
+
+        # Mark touched entries as stale (re-embedded in one batch on next search)
         if self._index is not None:
-            self.clear_index()
+            self._stale_keys.update(key_to_items.keys())
 
         logger.debug("items_added", count=len(key_to_items), size=self.size)
 
@@ -438,7 +518,7 @@ class OMem(BaseMem[T], Generic[T]):
 
             del self._storage[key]
             if self._index is not None:
-                self.clear_index()
+                self._stale_keys.add(key)
             logger.debug("item_removed", key=key, size=self.size)
             return True
         return False
@@ -463,6 +543,8 @@ class OMem(BaseMem[T], Generic[T]):
     def clear_index(self) -> None:
         """Clear the vector index without affecting stored items."""
         self._index = None
+        self._doc_ids = {}
+        self._stale_keys = set()
         logger.info("index_cleared")
 
     # --- Search & Indexing ---
@@ -471,8 +553,12 @@ class OMem(BaseMem[T], Generic[T]):
         """Build/rebuild the vector index from current memory state.
 
         This operation:
-        1. Serializes all items as documents.
-        2. Builds FAISS index via LangChain.
+        1. Serializes all items as text.
+        2. Embeds all texts in a single batched `embed_documents` call.
+        3. Builds FAISS index via LangChain.
+
+        Once built, the index is kept up to date incrementally: items touched by
+        `add()`/`remove()` are re-embedded together on the next search.
 
         Args:
             force: If True, rebuild even if index exists. Default: False.
@@ -489,29 +575,18 @@ class OMem(BaseMem[T], Generic[T]):
             logger.debug("index_already_built")
             return
 
-        items = self.items
-        logger.info("building_index", items=len(items))
+        entries = dict(self._storage)
+        logger.info("building_index", items=len(entries))
 
-        if not items:
+        self.clear_index()
+
+        if not entries:
             logger.debug("no_items_to_index")
             return
 
-        # 1. Serialize items as documents
-        documents = []
-        for item in items:
-            content = self._serialize_for_embedding(item)
-            key = self.key_extractor(item)
-            documents.append(
-                Document(
-                    page_content=content,
-                    metadata={"key": key, "raw": item.model_dump()},
-                )
-            )
-
-        # 2. Build FAISS index
         try:
-            self._index = FAISS.from_documents(documents, self.embedder)
-            logger.info("index_built", documents=len(documents))
+            self._embed_into_index(entries)
+            logger.info("index_built", documents=len(entries))
         except ImportError:
             logger.error("faiss_import_error")
             raise
@@ -520,7 +595,7 @@ class OMem(BaseMem[T], Generic[T]):
         """Semantic search over memory using vector similarity.
 
         Automatically rebuilds index if not built. Returns entities ranked by
-        similarity (closest first).
+        cosine similarity (closest first).
 
         Args:
             query: Natural language query string.
@@ -529,6 +604,24 @@ class OMem(BaseMem[T], Generic[T]):
         Returns:
             List of entities ranked by similarity.
 
+        Raises:
+            RuntimeError: If no embedder provided at initialization.
+        """
+        return self.search_batch([query], top_k=top_k)[0]
+
+    def search_batch(self, queries: List[str], top_k: int = 5) -> List[List[T]]:
+        """Semantic search for several queries in one index pass.
+
+        Query embeddings come from the same cache as `search()`, and the
+        stacked query matrix is searched with a single FAISS call.
+
+        Args:
+            queries: Natural language query strings.
+            top_k: Number of results to return per query. Default: 5.
+
+        Returns:
+            One list of entities per query, each ranked by similarity.
+
         Raises:
             RuntimeError: If no embedder provided at initialization.
         """
@@ -536,38 +629,145 @@ class OMem(BaseMem[T], Generic[T]):
             raise RuntimeError(
                 "Search unavailable: No embedder provided at initialization."
             )
+        if not queries:
+            return []
 
-        # Auto-rebuild if needed
+        # Auto-rebuild if needed, otherwise catch up on pending changes
         if self._index is None:
             logger.debug("rebuilding_index_before_search")
             self.build_index()
+        else:
+            self._refresh_index()
 
         if self._index is None:
             logger.debug("index_empty_no_results")
-            return []
+            return [[] for _ in queries]
 
         # Search using FAISS
         try:
-            docs = self._index.similarity_search(query, k=top_k)
-            results = []
+            query_matrix = np.stack([self._query_vector(query) for query in queries])
+            _, positions = self._index.index.search(query_matrix, top_k)
+        except Exception as e:
+            logger.error("search_failed", error=str(e))
+            return [[] for _ in queries]
 
-            for doc in docs:
+        pos_to_id = self._index.index_to_docstore_id
+        results = []
+        for row in positions:
+            hits = []
+            for pos in row:
+                # FAISS pads rows with -1 when fewer than top_k vectors match
+                if pos == -1:
+                    continue
                 try:
+                    doc = self._index.docstore.search(pos_to_id[pos])
                     key = doc.metadata.get("key")
                     if key is not None and key in self._storage:
-                        results.append(self._storage[key])
+                        hits.append(self._storage[key])
                 except Exception as e:
                     logger.warning("search_result_restore_failed", error=str(e))
-                    continue
+            results.append(hits)
 
-            logger.debug("search_completed", results=len(results), query=query)
-            return results
-        except Exception as e:
-            logger.error("search_failed", error=str(e))
+        logger.debug(
+            "search_completed", queries=len(queries), results=sum(map(len, results))
+        )
+        return results
+
+    def find_duplicates(
+        self, threshold: float = 0.92, batch_size: int = 5000
+    ) -> List[Tuple[Any, Any, float]]:
+        """Find pairs of entities whose embeddings are near-identical.
+
+        Uses the vector index's range search, querying `batch_size` stored
+        vectors at a time, so peak memory stays bounded by the batch and the
+        number of matches rather than growing as N². Nothing is modified;
+        callers decide whether to remove or merge the reported pairs.
+
+        Args:
+            threshold: Minimum cosine similarity for a pair. Default: 0.92.
+            batch_size: Number of vectors queried per range search. Default: 5000.
+
+        Returns:
+            List of (key_a, key_b, similarity) tuples, each pair reported once,
+            sorted by similarity (highest first).
+
+        Raises:
+            RuntimeError: If no embedder provided at initialization.
+            ValueError: If the index type is BINARY, which has no cosine scores.
+        """
+        if self.embedder is None:
+            raise RuntimeError(
+                "Duplicate search unavailable: No embedder provided at initialization."
+            )
+        if self.index_type == IndexType.BINARY:
+            raise ValueError(
+                "find_duplicates needs cosine similarities, which IndexType.BINARY "
+                "does not provide."
+            )
+
+        if self._index is None:
+            self.build_index()
+        else:
+            self._refresh_index()
+
+        if self._index is None:
             return []
 
+        index = self._index.index
+        if isinstance(index, faiss.IndexIVF):
+            index.make_direct_map()
+
+        id_to_key = {doc_id: key for key, doc_id in self._doc_ids.items()}
+        pos_to_key = [
+            id_to_key.get(self._index.index_to_docstore_id[pos])
+            for pos in range(index.ntotal)
+        ]
+
+        pairs = []
+        for start in range(0, index.ntotal, batch_size):
+            vectors = index.reconstruct_n(start, min(batch_size, index.ntotal - start))
+            lims, sims, positions = index.range_search(vectors, threshold)
+            for row in range(len(vectors)):
+                pos_a = start + row
+                for sim, pos_b in zip(
+                    sims[lims[row]:lims[row + 1]], positions[lims[row]:lims[row + 1]]
+                ):
+                    # Each pair shows up from both ends; keep it once
+                    if pos_b > pos_a:
+                        pairs.append((pos_to_key[pos_a], pos_to_key[pos_b], float(sim)))
+
+        pairs.sort(key=lambda pair: -pair[2])
+        logger.debug("duplicates_found", pairs=len(pairs), threshold=threshold)
+        return pairs
+
     # --- Persistence (Fine-grained v0.1.5+) ---
 
+    def dump(self, folder_path: Union[str, Path]) -> None:
+        """Save memory state to disk (data + metadata + index + merge cache).
+
+        Extends BaseMem.dump() by saving the LLM merge cache to
+        merge_cache.json when an LLM merger is in use.
+
+        Args:
+            folder_path: Base directory path to save memory data.
+        """
+        super().dump(folder_path)
+        if isinstance(self._merger, BaseLLMMerger):
+            self._merger.dump_cache(Path(folder_path) / "merge_cache.json")
+
+    def load(self, folder_path: Union[str, Path]) -> None:
+        """Load memory state from disk (merge cache + data + metadata + index).
+
+        The LLM merge cache is restored first so merges triggered while
+        loading data can be served from it.
+
+        Args:
+            folder_path: Base directory path to load memory data from.
+        """
+        if isinstance(self._merger, BaseLLMMerger):
+            self._merger.load_cache(Path(folder_path) / "merge_cache.json")
+        super().load(folder_path)
+
     def dump_data(self, file_path: Union[str, Path]) -> None:
         """Save structured data to a JSON file (data only).
 
@@ -578,9 +778,11 @@ class OMem(BaseMem[T], Generic[T]):
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            data = [item.model_dump(mode="json") for item in self.items]
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            # Serialized to UTF-8 bytes in one pydantic-core (Rust) call
+            write_bytes_atomic(
+                file_path,
+                self._list_adapter.dump_json(self.items, indent=2, fallback=str),
+            )
             logger.info("data_persisted", path=str(file_path))
         except Exception as e:
             logger.error("data_persist_failed", error=str(e))
@@ -589,7 +791,8 @@ class OMem(BaseMem[T], Generic[T]):
     def dump_index(self, folder_path: Union[str, Path]) -> None:
         """Save vector index to a folder.
 
-        Index files will be saved directly in this folder.
+        Index files will be saved directly in this folder. They are written to
+        a staging folder first, so a failed save keeps the previous files.
 
         Args:
             folder_path: Folder path where index files will be saved.
@@ -600,9 +803,11 @@ class OMem(BaseMem[T], Generic[T]):
             logger.debug("no_index_to_save")
             return
 
+        self._refresh_index()
+
         try:
-            folder_path.mkdir(parents=True, exist_ok=True)
-            self._index.save_local(str(folder_path))
+            with staged_folder(folder_path) as staging:
+                self._index.save_local(str(staging))
             logger.info("index_persisted", path=str(folder_path))
         except Exception as e:
             logger.warning("index_save_failed", error=str(e))
@@ -611,6 +816,9 @@ class OMem(BaseMem[T], Generic[T]):
     def load_data(self, file_path: Union[str, Path]) -> None:
         """Load structured data from a JSON file.
 
+        The raw bytes are parsed and validated directly into entities by
+        pydantic-core, without materializing an intermediate dict tree.
+
         Args:
             file_path: File path to load the data from.
         """
@@ -620,10 +828,7 @@ class OMem(BaseMem[T], Generic[T]):
             if not file_path.exists():
                 raise FileNotFoundError(f"Memory data file not found: {file_path}")
 
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            items = [self.memory_schema(**d) for d in data]
+            items = self._list_adapter.validate_json(file_path.read_bytes())
             self.add(items)
             logger.info("data_loaded", path=str(file_path), items=len(items))
 
@@ -643,14 +848,27 @@ class OMem(BaseMem[T], Generic[T]):
             logger.debug("no_index_folder", path=str(folder_path))
             return
 
+        from langchain_core.documents import Document
+        from langchain_community.vectorstores import FAISS
+        from langchain_community.vectorstores.utils import DistanceStrategy
+
         try:
             self._index = FAISS.load_local(
-                str(folder_path), self.embedder, allow_dangerous_deserialization=True
+                str(folder_path),
+                self.embedder,
+                allow_dangerous_deserialization=True,
+                distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT,
             )
+            self._doc_ids = {}
+            for doc_id in self._index.index_to_docstore_id.values():
+                doc = self._index.docstore.search(doc_id)
+                if isinstance(doc, Document):
+                    self._doc_ids[doc.metadata.get("key")] = doc_id
+            self._stale_keys = set()
             logger.info("index_loaded", path=str(folder_path))
         except Exception as e:
             logger.warning("index_load_failed", error=str(e))
-            self._index = None
+            self.clear_index()
             raise
 
     def dump_metadata(self, file_path: Union[str, Path]) -> None:
@@ -667,9 +885,19 @@ class OMem(BaseMem[T], Generic[T]):
                 "schema_name": self.memory_schema.__name__,
                 "size": self.size,
                 "fields_for_index": self.fields_for_index,
+                # Requested type; built_index_type is what is on disk, which
+                # differs for AUTO and after a fallback on too few vectors
+                "index_type": self.index_type.value,
+                "built_index_type": (
+                    built_index_type(self._index.index).value
+                    if self._index is not None
+                    else None
+                ),
             }
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False, default=str)
+            write_bytes_atomic(
+                file_path,
+                json.dumps(metadata, indent=2, ensure_ascii=False, default=str).encode("utf-8"),
+            )
             logger.info("metadata_persisted", path=str(file_path))
         except Exception as e:
             logger.warning("metadata_persist_failed", error=str(e))
@@ -700,6 +928,205 @@ class OMem(BaseMem[T], Generic[T]):
 
     # --- Private Helpers ---
 
+    def _resolve_extractor(
+        self, extractor: Union[str, Sequence[str], Callable[[T], Any]]
+    ) -> Callable[[T], Any]:
+        """Turn field name(s) into a C-level attrgetter; pass callables through.
+
+        A single name yields the field value; a list or tuple of names yields
+        a tuple of their values (a composite key).
+
+        Raises:
+            ValueError: If a field name is not in memory_schema.
+        """
+        if callable(extractor):
+            return extractor
+        fields = (extractor,) if isinstance(extractor, str) else tuple(extractor)
+        for field in fields:
+            if field not in self.memory_schema.model_fields:
+                raise ValueError(
+                    f"Field '{field}' not in memory_schema '{self.memory_schema.__name__}'"
+                )
+        return operator.attrgetter(*fields)
+
+    def _exact_dedup(self, key_to_items: Dict[Any, List[T]]) -> Dict[Any, List[T]]:
+        """Remove incoming items that are byte-identical to one already seen.
+
+        Items are compared by a SHA-256 digest of their JSON serialization,
+        against the stored item for the key and earlier incoming items.
+        Items that cannot be serialized to JSON (arbitrary-type fields) are
+        always kept. New keys with a single incoming item cannot hold a
+        duplicate and are not hashed. Keys left with nothing new are dropped
+        entirely.
+
+        Args:
+            key_to_items: Incoming items grouped by key.
+
+        Returns:
+            The grouping with exact duplicates removed.
+        """
+        deduped: Dict[Any, List[T]] = {}
+        dropped = 0
+        for key, new_items in key_to_items.items():
+            if len(new_items) == 1 and key not in self._storage:
+                deduped[key] = new_items
+                continue
+
+            seen: Set[str] = set()
+            if key in self._storage:
+                seen.add(self._content_hash(self._storage[key]))
+
+            unique_items = []
+            for item in new_items:
+                digest = self._content_hash(item)
+                if digest is None:
+                    unique_items.append(item)
+                    continue
+                if digest in seen:
+                    dropped += 1
+                    continue
+                seen.add(digest)
+                unique_items.append(item)
+
+            if unique_items:
+                deduped[key] = unique_items
+
+        if dropped:
+            logger.debug("exact_duplicates_dropped", count=dropped)
+        return deduped
+
+    @staticmethod
+    def _content_hash(item: T) -> Optional[str]:
+        """Return a SHA-256 digest of an entity's JSON serialization.
+
+        Returns None if the entity has values pydantic cannot serialize to JSON.
+        """
+        try:
+            data = item.model_dump_json()
+        except PydanticSerializationError:
+            return None
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def _embed_into_index(self, entries: Dict[Any, T]) -> None:
+        """Embed entries in one batched call and add them to the index.
+
+        Creates the index if it does not exist yet.
+
+        Args:
+            entries: Entities to embed and index, keyed by primary key.
+        """
+        keys = list(entries)
+        items = list(entries.values())
+        texts = [self._serialize_for_embedding(item) for item in items]
+        embeddings = self._normalize(self.embedder.embed_documents(texts))
+        metadatas = [
+            {"key": key, "raw": item.model_dump()} for key, item in zip(keys, items)
+        ]
+        doc_ids = [uuid.uuid4().hex for _ in items]
+
+        if self._index is None:
+            from langchain_community.docstore.in_memory import InMemoryDocstore
+            from langchain_community.vectorstores import FAISS
+            from langchain_community.vectorstores.utils import DistanceStrategy
+
+            self._index = FAISS(
+                self.embedder,
+                create_faiss_index(self.index_type, embeddings),
+                InMemoryDocstore(),
+                {},
+                distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT,
+            )
+        self._index.add_embeddings(
+            zip(texts, embeddings), metadatas=metadatas, ids=doc_ids
+        )
+        self._doc_ids.update(zip(keys, doc_ids))
+
+    def _embed_query(self, query: str) -> np.ndarray:
+        """Embed and L2-normalize a search query (read-only, as it is cached)."""
+        vector = self._normalize([self.embedder.embed_query(query)])[0]
+        vector.setflags(write=False)
+        return vector
+
+    @staticmethod
+    def _normalize(embeddings: List[List[float]]) -> np.ndarray:
+        """Stack embeddings into a float32 matrix and L2-normalize rows in place."""
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        faiss.normalize_L2(matrix)
+        return matrix
+
+    def _delete_from_index(self, doc_ids: List[str]) -> None:
+        """Remove documents from the index.
+
+        Flat indices (including float16) support in-place removal. Approximate
+        indices either cannot remove vectors (HNSW) or do not renumber them
+        (IVF), so they are rebuilt from the kept vectors without re-embedding.
+
+        Args:
+            doc_ids: Docstore ids to remove.
+        """
+        index = self._index.index
+        if isinstance(index, faiss.IndexFlatCodes):
+            self._index.delete(doc_ids)
+            return
+
+        drop = set(doc_ids)
+        kept = [
+            (pos, doc_id)
+            for pos, doc_id in sorted(self._index.index_to_docstore_id.items())
+            if doc_id not in drop
+        ]
+        if isinstance(index, faiss.IndexIVF):
+            index.make_direct_map()
+        vectors = index.reconstruct_n(0, index.ntotal)[[pos for pos, _ in kept]]
+
+        rebuilt = faiss.clone_index(index)
+        rebuilt.reset()
+        if len(vectors):
+            rebuilt.add(vectors)
+
+        self._index.index = rebuilt
+        self._index.index_to_docstore_id = {
+            i: doc_id for i, (_, doc_id) in enumerate(kept)
+        }
+        self._index.docstore.delete(doc_ids)
+
+    def _refresh_index(self) -> None:
+        """Re-embed stale entries and drop vectors of removed entries."""
+        if not self._stale_keys:
+            return
+
+        stale_keys = self._stale_keys
+        old_ids = []
+        entries = {}
+        reused = 0
+        for key in stale_keys:
+            item = self._storage.get(key)
+            doc_id = self._doc_ids.get(key)
+            if item is not None and doc_id is not None:
+                # A merge that leaves the embedded text unchanged keeps its vector
+                doc = self._index.docstore.search(doc_id)
+                if (
+                    not isinstance(doc, str)
+                    and doc.page_content == self._serialize_for_embedding(item)
+                ):
+                    doc.metadata["raw"] = item.model_dump()
+                    reused += 1
+                    continue
+            if doc_id is not None:
+                old_ids.append(self._doc_ids.pop(key))
+            if item is not None:
+                entries[key] = item
+
+        if old_ids:
+            self._delete_from_index(old_ids)
+        if entries:
+            self._embed_into_index(entries)
+
+        self._stale_keys = set()
+        logger.debug(
+            "index_refreshed", updated=len(entries), removed=len(old_ids), reused=reused
+        )
+
     def _serialize_for_embedding(self, item: T) -> str:
         """Convert entity to text string for embedding.
 
@@ -1,7 +1,8 @@
 """Merger strategies for ontomem."""
 
 from enum import Enum, nonmember
-from typing import TypeVar, Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar, Callable
 
 from pydantic import BaseModel
 
@@ -17,7 +18,8 @@ from .llm_merger import (
     CustomRuleMerger,
 )
 
-from langchain.chat_models import BaseChatModel
+if TYPE_CHECKING:
+    from langchain_core.language_models.chat_models import BaseChatModel
 
 
 # Type definitions
@@ -79,6 +81,9 @@ def create_merger(
     rule: str | None = None,
     dynamic_rule: Callable[[], str] | None = None,
     max_workers: int = 5,
+    cache_path: str | Path | None = None,
+    cache_size: int | None = 128,
+    union_conflict_free: bool = False,
 ) -> BaseMerger:
     """Factory function to create merger instances.
 
@@ -93,6 +98,13 @@ def create_merger(
         rule: Static merge rule string (required for CUSTOM_RULE strategy). Defaults to None.
         dynamic_rule: Optional callable returning a string with runtime-specific rules. Defaults to None.
         max_workers: Maximum concurrency for LLM batch calls (LLM strategies only). Defaults to 5.
+        cache_path: JSON file backing the LLM merge cache across runs (LLM strategies only).
+            Defaults to None (in-memory cache only).
+        cache_size: Maximum number of cached LLM merge results, evicting the least
+            recently used (LLM strategies only); None keeps every result. Defaults to 128.
+        union_conflict_free: Merge pairs whose fields do not conflict without calling
+            the LLM (BALANCED / PREFER_* only; custom rules may derive fields).
+            Defaults to False.
 
     Returns:
         Configured BaseMerger instance.
@@ -101,6 +113,7 @@ def create_merger(
         ValueError: If LLM strategy is used without llm_client or item_schema.
         TypeError: If strategy is not a valid MergeStrategy value.
         ValueError: If CUSTOM_RULE is used without rule parameter.
+        ValueError: If union_conflict_free is used with CUSTOM_RULE.
 
     Example:
         >>> from ontomem.merger import create_merger, MergeStrategy
@@ -163,6 +176,11 @@ def create_merger(
                 raise ValueError(
                     "Custom Rule LLM strategy requires 'rule' parameter."
                 )
+            if union_conflict_free:
+                raise ValueError(
+                    "union_conflict_free is not supported with the Custom Rule LLM "
+                    "strategy, whose rules may derive fields from both items."
+                )
             return CustomRuleMerger(
                 key_extractor=key_extractor,
                 llm_client=llm_client,
@@ -170,6 +188,8 @@ def create_merger(
                 rule=rule,
                 dynamic_rule=dynamic_rule,
                 max_workers=max_workers,
+                cache_path=cache_path,
+                cache_size=cache_size,
             )
 
         merger_cls = strategy_map[strategy]
@@ -178,6 +198,9 @@ def create_merger(
             llm_client=llm_client,
             item_schema=item_schema,
             max_workers=max_workers,
+            cache_path=cache_path,
+            cache_size=cache_size,
+            union_conflict_free=union_conflict_free,
         )
 
     # Classic strategies
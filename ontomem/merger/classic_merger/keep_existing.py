@@ -1,6 +1,6 @@
 """KeepExistingMerger - Always keep the existing (older) item."""
 
-from typing import TypeVar
+from typing import List, TypeVar
 
 from pydantic import BaseModel
 
@@ -21,6 +21,27 @@ class KeepExistingMerger(BaseMerger[T]):
         >>> # Result: [Item(id=1, version=1)]
     """
 
+    def merge(self, items: List[T]) -> List[T]:
+        """Keep the first item of each key without running merge rounds.
+
+        Keeping the existing item is associative, so the tournament in
+        BaseMerger.merge() always ends with each key's first item.
+
+        Args:
+            items: List of items to merge (may contain duplicates).
+
+        Returns:
+            List of deduplicated items, one per key.
+        """
+        if not items:
+            return []
+
+        groups = self._group_by_key(items)
+        merged_items = [group[0] for group in groups.values()]
+
+        self.logger.info("merge_completed", items_in=len(items), items_out=len(merged_items))
+        return merged_items
+
     def pair_merge(self, existing: T, incoming: T) -> T:
         """Keep the existing item, discard the incoming one.
 
@@ -1,8 +1,15 @@
 """FieldMerger - Merge at field level for Pydantic models."""
 
-from typing import TypeVar
+from functools import lru_cache, reduce
+from typing import List, Type, TypeVar
 
 from pydantic import BaseModel
+from pydantic.functional_validators import (
+    AfterValidator,
+    BeforeValidator,
+    PlainValidator,
+    WrapValidator,
+)
 
 from ...utils.logging import get_logger
 from ..base import BaseMerger
@@ -42,6 +49,45 @@ class FieldMerger(BaseMerger[T]):
         >>> # Result: [Person(name="Alice", age=30, city="NYC")]
     """
 
+    def merge(self, items: List[T]) -> List[T]:
+        """Merge items per key by folding them in a single pass.
+
+        Field overlay is associative, so the tournament in BaseMerger.merge()
+        gives the same result as overlaying each key's items in order. Doing it
+        in one pass builds one model per key instead of one per pair and round.
+
+        Args:
+            items: List of items to merge (may contain duplicates).
+
+        Returns:
+            List of deduplicated and merged items.
+        """
+        if not items:
+            return []
+
+        groups = self._group_by_key(items)
+        self.logger.info("items_grouped", items_in=len(items), keys=len(groups))
+
+        merged_items = [self._fold(group) for group in groups.values()]
+
+        self.logger.info("merge_completed", items_out=len(merged_items))
+        return merged_items
+
+    def _fold(self, group: List[T]) -> T:
+        """Overlay a key's items in order, assembling the result once."""
+        schema = type(group[-1])
+        if len(group) == 1 or any(type(item) is not schema for item in group):
+            return reduce(self.pair_merge, group)
+
+        merged_data = {}
+        for item in group:
+            merged_data.update(_non_none_values(item))
+        try:
+            return _assemble(schema, merged_data)
+        except Exception as e:
+            logger.error("field_merger_failed", error=str(e))
+            return group[-1]
+
     def pair_merge(self, existing: T, incoming: T) -> T:
         """Merge fields from both items, with incoming taking precedence.
 
@@ -61,12 +107,21 @@ class FieldMerger(BaseMerger[T]):
             AttributeError: If items are not Pydantic models.
         """
         try:
+            schema = type(incoming)
+            if type(existing) is schema:
+                # Both sides are already-validated instances of the same model,
+                # so the overlaid values are assembled without re-validation
+                # unless the schema has validators that must see the result
+                merged_data = _non_none_values(existing)
+                merged_data.update(_non_none_values(incoming))
+                return _assemble(schema, merged_data)
+
             # Get all non-None fields from existing as base
             merged_data = existing.model_dump(exclude_none=True)
             # Overlay incoming's non-None values (new data takes precedence)
             merged_data.update(incoming.model_dump(exclude_none=True))
             # Reconstruct item with merged data
-            return type(incoming)(**merged_data)
+            return schema(**merged_data)
         except AttributeError as e:
             logger.error(
                 "field_merger_type_error",
@@ -78,3 +133,44 @@ class FieldMerger(BaseMerger[T]):
         except Exception as e:
             logger.error("field_merger_failed", error=str(e))
             return incoming
+
+
+def _non_none_values(item: BaseModel) -> dict:
+    """Return an item's top-level field (and extra) values that are not None."""
+    values = dict(item.__dict__)
+    if item.__pydantic_extra__:
+        values.update(item.__pydantic_extra__)
+    return {name: value for name, value in values.items() if value is not None}
+
+
+def _assemble(schema: Type[T], merged_data: dict) -> T:
+    """Build a merged item, validating it only if the schema has validators.
+
+    Overlaying valid values field by field keeps each field valid, but
+    validators may enforce more than that (caps, derived fields, cross-field
+    checks), so schemas that declare any get a full model_validate().
+    """
+    if _has_validators(schema):
+        return schema.model_validate(merged_data)
+    return schema.model_construct(_fields_set=set(merged_data), **merged_data)
+
+
+_VALIDATOR_MARKERS = (AfterValidator, BeforeValidator, PlainValidator, WrapValidator)
+
+
+@lru_cache(maxsize=128)
+def _has_validators(schema: Type[BaseModel]) -> bool:
+    """Return True if a model declares field or model validators."""
+    decorators = schema.__pydantic_decorators__
+    if (
+        decorators.validators
+        or decorators.field_validators
+        or decorators.root_validators
+        or decorators.model_validators
+    ):
+        return True
+    return any(
+        isinstance(marker, _VALIDATOR_MARKERS)
+        for field in schema.model_fields.values()
+        for marker in field.metadata
+    )
@@ -1,19 +1,31 @@
 """Base class for LLM-powered merge strategies."""
 
+import hashlib
+import json
+from collections import OrderedDict
 from abc import abstractmethod
-from typing import Any, Callable, List, Tuple, TypeVar
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 
-from pydantic import BaseModel
-from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_core.prompts import ChatPromptTemplate
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_core import PydanticSerializationError
 
 from ..base import BaseMerger
+from ...utils.io import write_bytes_atomic
 from ...utils.logging import get_logger
 
+# langchain_core chat models and prompts are slow to import; defer to first use
+if TYPE_CHECKING:
+    from langchain_core.language_models.chat_models import BaseChatModel
+    from langchain_core.prompts import ChatPromptTemplate
+
 T = TypeVar("T", bound=BaseModel)
 
 logger = get_logger(__name__)
 
+# `_llm_type` reported by langchain_anthropic.ChatAnthropic
+ANTHROPIC_LLM_TYPE = "anthropic-chat"
+
 
 class BaseLLMMerger(BaseMerger[T]):
     """Abstract base class for LLM-powered merge strategies.
@@ -25,14 +37,31 @@ class BaseLLMMerger(BaseMerger[T]):
     Subclasses should override:
     - @property system_prompt: Return the system prompt string for merge behavior
     - optionally override pair_merge() for custom fallback behavior
+
+    Successful LLM merges are cached by a SHA-256 digest of
+    (item schema, system prompt, existing JSON, incoming JSON), so re-merging
+    identical inputs returns the stored result without an LLM call. With
+    `cache_path` set, the cache is also kept on disk across runs. Only the
+    `cache_size` most recently used results are kept (all of them if None).
+
+    Pairs where one side adds nothing to the other (every field is None,
+    empty, equal to the other side's value, or a list whose elements the
+    other side already has) are resolved without an LLM call by keeping the
+    more complete item. With `union_conflict_free=True`, pairs whose fields
+    merely complement each other are also merged without the LLM, by taking
+    the non-empty side of each field and unioning lists. That is off by
+    default because it skips any synthesis the prompt asks for.
     """
 
     def __init__(
         self,
         key_extractor: Callable[[T], Any],
-        llm_client: BaseChatModel,
+        llm_client: "BaseChatModel",
         item_schema: type[T],
         max_workers: int = 5,
+        cache_path: Optional[Union[str, Path]] = None,
+        cache_size: Optional[int] = 128,
+        union_conflict_free: bool = False,
     ):
         """Initialize LLM merger.
 
@@ -41,12 +70,42 @@ class BaseLLMMerger(BaseMerger[T]):
             llm_client: LangChain LLM instance (e.g., ChatOpenAI).
             item_schema: Pydantic model class of items.
             max_workers: Maximum concurrency for LLM batch calls. Defaults to 5.
+            cache_path: Optional JSON file backing the merge cache. Loaded on init
+                        (if it exists) and rewritten after merges add new entries.
+            cache_size: Maximum number of cached merge results. The least recently
+                        used entries are evicted beyond it; None keeps every result.
+                        Defaults to 128.
+            union_conflict_free: Merge pairs without conflicting field values
+                        deterministically instead of calling the LLM. Defaults to False.
+
+        Raises:
+            ValueError: If cache_size is negative.
         """
         super().__init__(key_extractor)
         self.llm_client = llm_client
         self.item_schema = item_schema
         self.max_workers = max_workers
         self.logger = logger
+        if cache_size is not None and cache_size < 0:
+            raise ValueError(f"cache_size must be >= 0, got {cache_size}")
+        self.cache_size = cache_size
+        self.union_conflict_free = union_conflict_free
+        # Structure: {sha256(schema, prompt, existing, incoming): merged_item},
+        # ordered from least to most recently used
+        self._cache: "OrderedDict[str, T]" = OrderedDict()
+        self._cache_dirty = False
+        # (De)serializes the whole cache in one pydantic-core call
+        self._cache_adapter = TypeAdapter(Dict[str, item_schema])
+        self.cache_path = Path(cache_path) if cache_path is not None else None
+        # Schema changes must not serve results shaped by an older schema
+        self._schema_fingerprint = hashlib.sha256(
+            json.dumps(item_schema.model_json_schema(), sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        if self.cache_path is not None:
+            self.load_cache(self.cache_path)
+        # Compiled prompt | structured-output chain, reused while the system
+        # prompt and client are unchanged: (system_prompt, llm_client, chain)
+        self._chain_cache: Optional[Tuple[str, Any, Any]] = None
 
     @property
     @abstractmethod
@@ -57,17 +116,57 @@ class BaseLLMMerger(BaseMerger[T]):
         """
         pass
 
-    def build_prompt(self) -> ChatPromptTemplate:
+    def build_prompt(self, system_prompt: Optional[str] = None) -> "ChatPromptTemplate":
         """Build the prompt template using the current system prompt.
 
+        The static system prompt comes first and the per-pair records last, so
+        providers with automatic prefix caching (e.g. OpenAI) reuse the prefix
+        across merges. For Anthropic models the system block is additionally
+        marked with `cache_control`, which caches the schema tool and the prompt.
+
+        Args:
+            system_prompt: System prompt to use. Defaults to `self.system_prompt`.
+
         Returns:
             A ChatPromptTemplate containing the system prompt and the user input structure.
         """
+        from langchain_core.messages import SystemMessage
+        from langchain_core.prompts import ChatPromptTemplate
+
+        if system_prompt is None:
+            system_prompt = self.system_prompt
+
+        if getattr(self.llm_client, "_llm_type", None) == ANTHROPIC_LLM_TYPE:
+            system = SystemMessage(content=[{
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }])
+        else:
+            system = ("system", system_prompt)
+
         return ChatPromptTemplate.from_messages([
-            ("system", self.system_prompt),
+            system,
             ("user", "Item A (existing):\n{item_existing}\n\nItem B (incoming):\n{item_incoming}")
         ])
 
+    def _merge_chain(self, system_prompt: str):
+        """Return the prompt | structured-output chain for a system prompt.
+
+        Building the template and binding the schema as a tool is repeated
+        work for every merge, so the last chain is kept until the system
+        prompt (e.g. from a dynamic rule) or the LLM client changes.
+        """
+        cached = self._chain_cache
+        if cached is not None and cached[0] == system_prompt and cached[1] is self.llm_client:
+            return cached[2]
+
+        chain = self.build_prompt(system_prompt) | self.llm_client.with_structured_output(
+            self.item_schema
+        )
+        self._chain_cache = (system_prompt, self.llm_client, chain)
+        return chain
+
     def pair_merge(self, existing: T, incoming: T) -> T:
         """Merge a single pair using LLM (default implementation).
 
@@ -81,16 +180,25 @@ class BaseLLMMerger(BaseMerger[T]):
         Returns:
             Merged item from LLM, or incoming item if LLM fails.
         """
+        merged = _conflict_free_merge(existing, incoming, self.union_conflict_free)
+        if merged is not None:
+            return merged
+
         try:
+            system_prompt = self.system_prompt
+            cache_key = self._cache_key(system_prompt, existing, incoming)
+            cached = self._cached_result(cache_key)
+            if cached is not None:
+                return cached
+
             self.logger.debug("llm_single_merge_fallback")
-            
-            prompt = self.build_prompt()
-            merge_chain = prompt | self.llm_client.with_structured_output(self.item_schema)
-            
-            merged = merge_chain.invoke({
-                "item_existing": existing.model_dump_json(indent=2),
-                "item_incoming": incoming.model_dump_json(indent=2),
-            })
+
+            merge_chain = self._merge_chain(system_prompt)
+
+            merged = merge_chain.invoke(_prompt_inputs(existing, incoming))
+            if merged is not None:
+                self._store_in_cache(cache_key, merged)
+                self._flush_cache()
             return merged
         except Exception as e:
             self.logger.error(
@@ -114,22 +222,41 @@ class BaseLLMMerger(BaseMerger[T]):
         if not pairs:
             return []
 
-        prompt = self.build_prompt()
-        merge_chain = prompt | self.llm_client.with_structured_output(self.item_schema)
+        results: List[Optional[T]] = [
+            _conflict_free_merge(existing, incoming, self.union_conflict_free)
+            for existing, incoming in pairs
+        ]
+        skipped = sum(result is not None for result in results)
+        if skipped:
+            self.logger.debug("llm_merge_conflict_free_pairs", skipped=skipped, pairs=len(pairs))
+
+        system_prompt = self.system_prompt
+        cache_keys: List[Optional[str]] = [None] * len(pairs)
+        hits = 0
+        for i, (existing, incoming) in enumerate(pairs):
+            if results[i] is not None:
+                continue
+            cache_keys[i] = self._cache_key(system_prompt, existing, incoming)
+            results[i] = self._cached_result(cache_keys[i])
+            hits += results[i] is not None
+        pending = [i for i, result in enumerate(results) if result is None]
+
+        if hits:
+            self.logger.debug("llm_merge_cache_hits", hits=hits, pairs=len(pairs))
+        if not pending:
+            return results
+
+        pending_pairs = [pairs[i] for i in pending]
+
+        merge_chain = self._merge_chain(system_prompt)
 
         self.logger.info(
             "llm_batch_merge_start",
-            pairs=len(pairs),
+            pairs=len(pending_pairs),
         )
 
         # Prepare batch inputs
-        inputs = [
-            {
-                "item_existing": existing.model_dump_json(indent=2),
-                "item_incoming": incoming.model_dump_json(indent=2),
-            }
-            for existing, incoming in pairs
-        ]
+        inputs = [_prompt_inputs(existing, incoming) for existing, incoming in pending_pairs]
 
         try:
             # Critical: Single batch API call for all pairs
@@ -138,19 +265,235 @@ class BaseLLMMerger(BaseMerger[T]):
             merged_results = merge_chain.batch(inputs, config=config)
             
             self.logger.info("llm_batch_merge_success", pairs=len(merged_results))
-            return merged_results
+
+            for i, merged in zip(pending, merged_results):
+                results[i] = merged
+                if merged is not None:
+                    self._store_in_cache(cache_keys[i], merged)
+            self._flush_cache()
+            return results
 
         except Exception as e:
             self.logger.error(
                 "llm_batch_merge_failed",
                 error=str(e),
-                pairs=len(pairs),
+                pairs=len(pending_pairs),
             )
 
             # Fallback: Sequential pair merges
-            results = []
-            for existing, incoming in pairs:
-                merged = self.pair_merge(existing, incoming)
-                results.append(merged)
+            for i, (existing, incoming) in zip(pending, pending_pairs):
+                results[i] = self.pair_merge(existing, incoming)
 
             return results
+
+    # ==================== Merge Cache ====================
+
+    def clear_cache(self) -> None:
+        """Drop all cached merge results (in memory; `cache_path` is left as is)."""
+        self._cache.clear()
+        self._cache_dirty = False
+
+    def dump_cache(self, file_path: Union[str, Path]) -> None:
+        """Save cached merge results to a JSON file.
+
+        Args:
+            file_path: File path to save the cache (e.g., "merge_cache.json").
+        """
+        file_path = Path(file_path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        write_bytes_atomic(
+            file_path, self._cache_adapter.dump_json(self._cache, indent=2, fallback=str)
+        )
+        self.logger.info(
+            "merge_cache_persisted", path=str(file_path), entries=len(self._cache)
+        )
+
+    def load_cache(self, file_path: Union[str, Path]) -> None:
+        """Load cached merge results from a JSON file (no-op if missing).
+
+        Args:
+            file_path: File path to load the cache from.
+        """
+        file_path = Path(file_path)
+        if not file_path.exists():
+            return
+
+        data = self._cache_adapter.validate_json(file_path.read_bytes())
+        self._cache.update(data)
+        self._evict_cache()
+        self.logger.info("merge_cache_loaded", path=str(file_path), entries=len(data))
+
+    def _cached_result(self, cache_key: Optional[str]) -> Optional[T]:
+        """Return a copy of a cached merge result and mark it as recently used.
+
+        Results end up in the caller's storage, so the cache hands out and
+        keeps its own copies; mutating a stored item never changes later hits.
+        """
+        if cache_key is None:
+            return None
+        merged = self._cache.get(cache_key)
+        if merged is None:
+            return None
+        self._cache.move_to_end(cache_key)
+        return merged.model_copy(deep=True)
+
+    def _store_in_cache(self, cache_key: Optional[str], merged: T) -> None:
+        """Record a successful merge result (pairs without a cache key are skipped)."""
+        if cache_key is None:
+            return
+        self._cache[cache_key] = merged.model_copy(deep=True)
+        self._cache.move_to_end(cache_key)
+        self._evict_cache()
+        self._cache_dirty = True
+
+    def _evict_cache(self) -> None:
+        """Drop least recently used results beyond `cache_size`."""
+        if self.cache_size is None:
+            return
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _flush_cache(self) -> None:
+        """Write new cache entries to `cache_path`, if configured."""
+        if self.cache_path is None or not self._cache_dirty:
+            return
+        try:
+            self.dump_cache(self.cache_path)
+            self._cache_dirty = False
+        except OSError as e:
+            self.logger.warning("merge_cache_persist_failed", error=str(e))
+
+    def _cache_key(self, system_prompt: str, existing: T, incoming: T) -> Optional[str]:
+        """Return the cache digest for merging a pair under a system prompt.
+
+        Returns None if either item has values pydantic cannot serialize to
+        JSON; such pairs are merged without the cache.
+        """
+        try:
+            parts = (
+                self._schema_fingerprint,
+                system_prompt,
+                existing.model_dump_json(),
+                incoming.model_dump_json(),
+            )
+        except PydanticSerializationError:
+            return None
+
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+
+def _prompt_inputs(existing: BaseModel, incoming: BaseModel) -> Dict[str, str]:
+    """Render a pair as compact JSON for the merge prompt.
+
+    None fields are left out: they carry nothing to merge, and the structured
+    output schema still makes the LLM return every field. Values pydantic
+    cannot serialize are shown by their str().
+    """
+    return {
+        "item_existing": existing.model_dump_json(exclude_none=True, fallback=str),
+        "item_incoming": incoming.model_dump_json(exclude_none=True, fallback=str),
+    }
+
+
+def _is_empty(value: Any) -> bool:
+    """Whether a field value carries no information (None or empty container)."""
+    if value is None:
+        return True
+    try:
+        return len(value) == 0
+    except TypeError:
+        return False
+
+
+def _list_contains(base: list, other: list) -> bool:
+    """Whether every element of `other` appears in `base`.
+
+    Uses a set for O(len(base) + len(other)) membership when elements are
+    hashable, and falls back to list scans for dicts or nested models.
+    """
+    try:
+        return set(base).issuperset(other)
+    except TypeError:
+        return all(element in base for element in other)
+
+
+def _list_union(base: list, other: list) -> list:
+    """Combine two lists without duplicates, keeping first-seen order.
+
+    Hashable elements are deduplicated in one `dict.fromkeys` pass; dicts or
+    nested models fall back to list scans.
+    """
+    try:
+        return list(dict.fromkeys(base + other))
+    except TypeError:
+        union = []
+        for element in base + other:
+            if element not in union:
+                union.append(element)
+        return union
+
+
+_CONFLICT = object()
+
+
+def _field_union(existing: Any, incoming: Any) -> Any:
+    """Merge two field values, or return `_CONFLICT` if they disagree.
+
+    Empty values yield to the other side, equal values are kept, and lists
+    are unioned. Two distinct non-empty scalars are a conflict.
+    """
+    if _is_empty(incoming) or incoming == existing:
+        return existing
+    if _is_empty(existing):
+        return incoming
+    if isinstance(existing, list) and isinstance(incoming, list):
+        if _list_contains(existing, incoming):
+            return existing
+        if _list_contains(incoming, existing):
+            return incoming
+        return _list_union(existing, incoming)
+    return _CONFLICT
+
+
+def _conflict_free_merge(existing: T, incoming: T, union: bool = False) -> Optional[T]:
+    """Merge a pair deterministically if no field holds two distinct values.
+
+    If one item already contains the other, that item is returned as is. With
+    `union`, complementary items are also merged: each field takes whichever
+    side is non-empty and list fields are unioned, and the result is validated
+    against the schema so its validators run.
+
+    Returns None when the pair needs the LLM: any field conflicts, the items
+    differ in type, the union is not requested, or it fails validation.
+    """
+    if type(existing) is not type(incoming):
+        return None
+
+    merged = {}
+    from_existing = from_incoming = True
+    for name, value in existing:
+        incoming_value = getattr(incoming, name)
+        result = _field_union(value, incoming_value)
+        if result is _CONFLICT:
+            return None
+        merged[name] = result
+        from_existing = from_existing and result is value
+        from_incoming = from_incoming and (
+            result is incoming_value or result == incoming_value
+        )
+
+    if from_existing:
+        return existing
+    if from_incoming:
+        return incoming
+    if not union:
+        return None
+    try:
+        return type(existing).model_validate(merged)
+    except ValidationError:
+        return None
@@ -1,12 +1,15 @@
 """Custom rule LLM merger."""
 
-from typing import Callable, Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional, Union
 
-from langchain_core.language_models.chat_models import BaseChatModel
 from pydantic import BaseModel
 
 from .base import BaseLLMMerger
 
+if TYPE_CHECKING:
+    from langchain_core.language_models.chat_models import BaseChatModel
+
 
 class CustomRuleMerger(BaseLLMMerger):
     """LLM merger with user-defined merge rules.
@@ -19,6 +22,10 @@ class CustomRuleMerger(BaseLLMMerger):
     context-aware instructions at runtime, enabling adaptive merging based on
     external state (e.g., current time, environment variables, etc.).
 
+    Rules may derive fields from both items (sums, picks, summaries), so pairs
+    are never unioned deterministically; only pairs where one item adds
+    nothing to the other skip the LLM.
+
     Example:
         >>> from datetime import datetime
         >>> 
@@ -38,11 +45,13 @@ class CustomRuleMerger(BaseLLMMerger):
     def __init__(
         self,
         key_extractor: callable,
-        llm_client: BaseChatModel,
+        llm_client: "BaseChatModel",
         item_schema: type[BaseModel],
         rule: str,
         dynamic_rule: Optional[Callable[[], str]] = None,
         max_workers: int = 5,
+        cache_path: Optional[Union[str, Path]] = None,
+        cache_size: Optional[int] = 128,
     ):
         """Initialize custom rule LLM merger.
 
@@ -54,12 +63,17 @@ class CustomRuleMerger(BaseLLMMerger):
             dynamic_rule: Optional callable that returns a string with runtime-specific
                          rules or context. Called each time system_prompt is accessed.
             max_workers: Maximum concurrency for LLM batch calls. Defaults to 5.
+            cache_path: Optional JSON file backing the merge cache. Defaults to None.
+            cache_size: Maximum number of cached merge results, or None for no limit.
+                        Defaults to 128.
 
         Raises:
             TypeError: If rule is not a string.
             TypeError: If dynamic_rule is provided but not callable.
         """
-        super().__init__(key_extractor, llm_client, item_schema, max_workers)
+        super().__init__(
+            key_extractor, llm_client, item_schema, max_workers, cache_path, cache_size
+        )
 
         if not isinstance(rule, str):
             raise TypeError(f"rule must be str, got {type(rule)}")
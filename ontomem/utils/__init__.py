@@ -1,5 +1,12 @@
 """Utility modules for ontomem."""
 
+from .io import staged_folder, write_bytes_atomic
 from .logging import get_logger, configure_logging, set_log_level
 
-__all__ = ["get_logger", "configure_logging", "set_log_level"]
+__all__ = [
+    "get_logger",
+    "configure_logging",
+    "set_log_level",
+    "staged_folder",
+    "write_bytes_atomic",
+]
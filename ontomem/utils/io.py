@@ -0,0 +1,98 @@
+"""File helpers for ontomem persistence."""
+
+import os
+import secrets
+import stat
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Union
+
+_TEMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+
+def write_bytes_atomic(
+    file_path: Union[str, Path], data: bytes, fsync: bool = False
+) -> None:
+    """Write bytes to a file so readers never observe a partial write.
+
+    The payload is written to a temporary file in the same directory and then
+    moved over the target with `os.replace`, which is atomic on POSIX and
+    Windows. If writing fails, the previous file is left untouched. The file
+    keeps the target's permissions, or gets the usual 0666 & ~umask if the
+    target is new.
+
+    Args:
+        file_path: Destination file path. Its parent directory must exist.
+        data: Complete file contents.
+        fsync: If True, also fsync the data before the replace and the
+            directory after it, so the new file survives a system crash.
+    """
+    file_path = Path(file_path)
+    tmp_name = file_path.parent / f".{file_path.name}.{secrets.token_hex(8)}.tmp"
+    # Created with 0666 so the kernel applies the process umask
+    fd = os.open(tmp_name, _TEMP_FLAGS, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        _copy_mode(file_path, tmp_name)
+        os.replace(tmp_name, file_path)
+        if fsync:
+            _fsync_dir(file_path.parent)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+@contextmanager
+def staged_folder(folder_path: Union[str, Path]) -> Iterator[Path]:
+    """Stage files for a folder and move them in only once all are written.
+
+    Yields a temporary directory next to `folder_path`. When the block exits
+    without an error, every file in it is moved into `folder_path` with
+    `os.replace`, so each file is swapped in whole, and the folder is synced
+    once. Other files in `folder_path` are left alone. If the block raises,
+    the staged files are discarded and `folder_path` is left untouched.
+
+    The files are replaced one by one, so a reader that opens them between
+    two replaces may see a new file next to an old one.
+
+    Args:
+        folder_path: Destination folder. Created if it does not exist.
+    """
+    folder_path = Path(folder_path)
+    folder_path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(
+        dir=folder_path.parent, prefix=f".{folder_path.name}.", suffix=".tmp"
+    ) as tmp_name:
+        staging = Path(tmp_name)
+        yield staging
+        folder_path.mkdir(exist_ok=True)
+        for staged in staging.iterdir():
+            os.replace(staged, folder_path / staged.name)
+        _fsync_dir(folder_path)
+
+
+def _copy_mode(source: Path, target: Union[str, Path]) -> None:
+    """Give `target` the permission bits of `source`, if `source` exists."""
+    try:
+        os.chmod(target, stat.S_IMODE(os.stat(source).st_mode))
+    except FileNotFoundError:
+        pass
+
+
+def _fsync_dir(path: Path) -> None:
+    """Flush a directory's entries to disk (a no-op where unsupported)."""
+    if os.name == "nt":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
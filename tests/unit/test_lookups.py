@@ -155,6 +155,37 @@ class TestLookupsMerge:
         assert len(memory.get_by_lookup("by_name", "Alice")) == 0
         assert len(memory.get_by_lookup("by_name", "Alicia")) == 1
 
+    def test_mixed_batch_updates_lookup(self, memory):
+        """Test one batch of merges and fresh inserts keeps the lookup consistent."""
+        memory.create_lookup("by_location", "location")
+        memory.add(Event(id="evt_001", char_name="Alice", location="Kitchen",
+                         content="Cooking", timestamp="08:00"))
+
+        memory.add([
+            Event(id="evt_001", char_name="Alice", location="Garden",
+                  content="Gardening", timestamp="14:00"),
+            Event(id="evt_002", char_name="Bob", location="Garden",
+                  content="Digging", timestamp="14:05"),
+        ])
+
+        assert memory.get_by_lookup("by_location", "Kitchen") == []
+        assert {e.id for e in memory.get_by_lookup("by_location", "Garden")} == {
+            "evt_001", "evt_002"
+        }
+
+    def test_unchanged_lookup_key_keeps_bucket(self, memory):
+        """Test a merge that keeps the lookup key leaves its entry in place."""
+        memory.create_lookup("by_location", "location")
+        memory.add(Event(id="evt_001", char_name="Alice", location="Kitchen",
+                         content="Cooking", timestamp="08:00"))
+        bucket = memory._lookups["by_location"]["Kitchen"]
+
+        memory.add(Event(id="evt_001", char_name="Alice", location="Kitchen",
+                         content="Baking", timestamp="09:00"))
+
+        assert memory._lookups["by_location"]["Kitchen"] is bucket
+        assert memory.get_by_lookup("by_location", "Kitchen")[0].content == "Baking"
+
     def test_merge_preserves_other_items(self, memory):
         """Test that merge doesn't affect other items in lookups."""
         memory.create_lookup("by_location", lambda x: x.location)
@@ -315,6 +346,20 @@ class TestLookupsComposite:
         kitchen_10am = memory.get_by_lookup("by_location_hour", "Kitchen:10")
         assert len(kitchen_10am) == 1
 
+    def test_composite_field_lookup(self, memory):
+        """Test a lookup over several field names is keyed by a value tuple."""
+        memory.add([
+            Event(id="evt_001", char_name="Alice", location="Kitchen",
+                  content="Cooking", timestamp="08:00"),
+            Event(id="evt_002", char_name="Alice", location="Garden",
+                  content="Gardening", timestamp="09:00"),
+        ])
+        memory.create_lookup("by_char_location", ["char_name", "location"])
+
+        results = memory.get_by_lookup("by_char_location", ("Alice", "Garden"))
+
+        assert [e.id for e in results] == ["evt_002"]
+
     def test_three_dimensional_lookup(self, memory):
         """Test lookups across three dimensions."""
         memory.create_lookup("by_name", lambda x: x.char_name)
@@ -137,6 +137,18 @@ class TestOMemBasicOperations:
         assert memory.keys == []
 
 
+    def test_container_protocol(self, memory):
+        """Test len(), `in`, indexing and iteration go through the store."""
+        item = SimpleItem(item_id="1", name="Alice")
+        memory.add([item, SimpleItem(item_id="2", name="Bob")])
+
+        assert len(memory) == 2
+        assert "1" in memory and "3" not in memory
+        assert memory["1"] == item
+        assert list(memory) == ["1", "2"]
+        with pytest.raises(KeyError):
+            memory["3"]
+
 class TestOMemKeyExtraction:
     """Test key extraction and ID handling."""
 
@@ -177,6 +189,65 @@ class TestOMemKeyExtraction:
         mem.add(user)
         assert mem.get("alice@example.com") == user
 
+    def test_field_name_key_extractor(self):
+        """Test key extractor given as a field name."""
+        mem = OMem(
+            memory_schema=SimpleItem,
+            key_extractor="item_id",
+            llm_client=None,
+            embedder=None,
+            strategy_or_merger=MergeStrategy.MERGE_FIELD
+        )
+        mem.add([
+            SimpleItem(item_id="1", name="Alice"),
+            SimpleItem(item_id="1", value=30),
+        ])
+        mem.create_lookup("by_name", "name")
+
+        assert mem.get("1").name == "Alice"
+        assert mem.get("1").value == 30
+        assert mem.get_by_lookup("by_name", "Alice") == [mem.get("1")]
+
+    def test_composite_field_key_extractor(self):
+        """Test key extractor given as several field names keys by a tuple."""
+        mem = OMem(
+            memory_schema=SimpleItem,
+            key_extractor=["item_id", "name"],
+            llm_client=None,
+            embedder=None,
+            strategy_or_merger=MergeStrategy.MERGE_FIELD
+        )
+        mem.add([
+            SimpleItem(item_id="1", name="Alice", value=1),
+            SimpleItem(item_id="1", name="Bob"),
+            SimpleItem(item_id="1", name="Alice", value=2),
+        ])
+
+        assert mem.size == 2
+        assert mem.get(("1", "Alice")).value == 2
+
+    def test_schema_adapter_shared_across_instances(self, memory):
+        """Test instances with the same schema reuse one list adapter."""
+        other = OMem(
+            memory_schema=SimpleItem,
+            key_extractor="item_id",
+            llm_client=None,
+            embedder=None,
+            strategy_or_merger=MergeStrategy.MERGE_FIELD
+        )
+        assert other._list_adapter is memory._list_adapter
+
+    def test_unknown_field_key_extractor_raises(self):
+        """Test key extractor field name must exist in the schema."""
+        with pytest.raises(ValueError):
+            OMem(
+                memory_schema=SimpleItem,
+                key_extractor="missing",
+                llm_client=None,
+                embedder=None,
+                strategy_or_merger=MergeStrategy.MERGE_FIELD
+            )
+
 
 class TestOMemTypeValidation:
     """Test type checking and validation."""
@@ -1,8 +1,10 @@
 """Unit tests for merge strategies."""
 import os
+from typing import Any
 import pytest
 from unittest.mock import Mock, MagicMock, patch
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, field_validator, model_validator
+from langchain_core.runnables import RunnableLambda
 
 from ontomem import OMem
 from ontomem.merger import MergeStrategy, create_merger, CustomRuleMerger
@@ -24,6 +26,27 @@ def llm_client():
         return Mock()
 
 
+class FakeStructuredLLM:
+    """Offline stand-in for a chat model with structured output.
+
+    Every LLM call returns `result`, is counted in `calls`, and has its
+    prompt text recorded in `prompts`.
+    """
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+        self.prompts = []
+
+    def with_structured_output(self, schema):
+        def respond(prompt_value):
+            self.calls += 1
+            self.prompts.append(prompt_value.to_string())
+            return self.result
+
+        return RunnableLambda(respond)
+
+
 class Profile(BaseModel):
     uid: str
     name: str | None = None
@@ -70,6 +93,60 @@ class TestMergeFieldStrategy:
         assert result.name == "Alice"  # Preserved
         assert result.bio == "Engineer"  # Preserved
 
+    def test_merge_field_folds_batch_in_order(self, memory):
+        """Test a batch for one key matches overlaying its items in order."""
+        items = [
+            Profile(uid="u1", name="Alice", bio="Engineer"),
+            Profile(uid="u1", skills=["Python"]),
+            Profile(uid="u1", name="Alice Smith"),
+            Profile(uid="u1", bio="Researcher", skills=["AI"]),
+            Profile(uid="u1"),
+        ]
+        memory.add(items)
+
+        expected = items[0]
+        for item in items[1:]:
+            expected = memory._merger.pair_merge(expected, item)
+        assert memory.get("u1") == expected
+        assert memory.get("u1").name == "Alice Smith"
+        assert memory.get("u1").bio == "Researcher"
+
+    def test_merge_field_skips_revalidation(self, memory):
+        """Test merged items are assembled without re-running validation."""
+        memory.add(Profile(uid="u1", name="Alice"))
+        with patch.object(Profile, "__init__", side_effect=AssertionError):
+            memory.add(Profile.model_construct(uid="u1", bio="Engineer"))
+
+        result = memory.get("u1")
+        assert result == Profile(uid="u1", name="Alice", skills=[], bio="Engineer")
+        assert result.model_fields_set == {"uid", "name", "skills", "bio"}
+
+    def test_merge_field_runs_schema_validators(self):
+        """Test schemas with validators get their merged items validated."""
+        class Contact(BaseModel):
+            uid: str
+            name: str | None = None
+            city: str | None = None
+            label: str | None = None
+
+            @model_validator(mode="after")
+            def derive_label(self):
+                self.label = f"{self.name} ({self.city})"
+                return self
+
+        memory = OMem(
+            memory_schema=Contact,
+            key_extractor=lambda x: x.uid,
+            llm_client=None,
+            embedder=None,
+            strategy_or_merger=MergeStrategy.MERGE_FIELD
+        )
+        memory.add([Contact(uid="c1", name="Alice"), Contact(uid="c1", city="NYC")])
+        assert memory.get("c1").label == "Alice (NYC)"
+
+        memory.add(Contact(uid="c1", city="Paris"))
+        assert memory.get("c1").label == "Alice (Paris)"
+
 
 class TestKeepIncomingStrategy:
     """Test KEEP_INCOMING strategy: latest entry wins."""
@@ -97,6 +174,13 @@ class TestKeepIncomingStrategy:
         assert result.skills == ["Java"]
         assert result.bio is None  # Even None overwrites
 
+    def test_keep_incoming_batch_keeps_last(self, memory):
+        """Test the last of several same-key items in one batch wins."""
+        memory.add(Profile(uid="u1", name="Alice"))
+        memory.add([Profile(uid="u1", name=name) for name in ["Bob", "Carol", "Dave"]])
+
+        assert memory.get("u1").name == "Dave"
+
 
 class TestKeepExistingStrategy:
     """Test KEEP_EXISTING strategy: first entry wins."""
@@ -123,6 +207,13 @@ class TestKeepExistingStrategy:
         assert result.name == "Alice"
         assert result.skills == ["Python"]
 
+    def test_keep_existing_batch_keeps_first(self, memory):
+        """Test the stored item wins over a batch of same-key items."""
+        memory.add(Profile(uid="u1", name="Alice"))
+        memory.add([Profile(uid="u1", name=name) for name in ["Bob", "Carol", "Dave"]])
+
+        assert memory.get("u1").name == "Alice"
+
 
 class TestBatchMerge:
     """Test batch merging logic."""
@@ -177,6 +268,106 @@ class TestBatchMerge:
         assert memory.get("u2").name == "Bob"
 
 
+class TestExactDuplicateSkip:
+    """Test that byte-identical items never reach the LLM merger."""
+
+    @pytest.fixture
+    def merger(self):
+        llm_merger = create_merger(
+            MergeStrategy.LLM.BALANCED,
+            key_extractor=lambda x: x.uid,
+            llm_client=FakeStructuredLLM(None),
+            item_schema=Profile,
+        )
+        merger = Mock(spec=llm_merger)
+        merger.merge.side_effect = lambda items: [items[-1]]
+        return merger
+
+    @pytest.fixture
+    def memory(self, merger):
+        return OMem(
+            memory_schema=Profile,
+            key_extractor=lambda x: x.uid,
+            llm_client=None,
+            embedder=None,
+            strategy_or_merger=merger
+        )
+
+    def test_duplicate_of_stored_item_skips_merge(self, memory, merger):
+        """Test re-adding an identical item does not call the merger."""
+        memory.add(Profile(uid="u1", name="Alice", skills=["Python"]))
+        memory.add(Profile(uid="u1", name="Alice", skills=["Python"]))
+
+        merger.merge.assert_not_called()
+        assert memory.size == 1
+
+    def test_duplicates_within_batch_collapse(self, memory, merger):
+        """Test identical items in one batch are inserted without merging."""
+        memory.add([
+            Profile(uid="u1", name="Alice"),
+            Profile(uid="u1", name="Alice"),
+            Profile(uid="u2", name="Bob"),
+        ])
+
+        merger.merge.assert_not_called()
+        assert memory.size == 2
+
+    def test_distinct_items_still_merge(self, memory, merger):
+        """Test that differing items with the same key are merged once."""
+        memory.add([
+            Profile(uid="u1", name="Alice"),
+            Profile(uid="u1", name="Alice"),
+            Profile(uid="u1", name="Alice Smith"),
+        ])
+
+        merger.merge.assert_called_once()
+        assert len(merger.merge.call_args.args[0]) == 2
+
+    def test_single_new_items_are_not_hashed(self, memory):
+        """Test new keys with one incoming item skip hashing entirely."""
+        with patch.object(OMem, "_content_hash", side_effect=AssertionError):
+            memory.add([Profile(uid="u1", name="Alice"), Profile(uid="u2", name="Bob")])
+
+        assert memory.size == 2
+
+    def test_classic_merger_skips_dedup(self):
+        """Test non-LLM mergers get duplicates without any hashing."""
+        memory = OMem(
+            memory_schema=Profile,
+            key_extractor=lambda x: x.uid,
+            llm_client=None,
+            embedder=None,
+            strategy_or_merger=MergeStrategy.KEEP_INCOMING
+        )
+        with patch.object(OMem, "_content_hash", side_effect=AssertionError):
+            memory.add([Profile(uid="u1", name="Alice"), Profile(uid="u1", name="Alice")])
+
+        assert memory.get("u1") == Profile(uid="u1", name="Alice")
+
+    def test_unserializable_items_are_added(self, merger):
+        """Test items with arbitrary-type fields skip dedup instead of failing."""
+        class Handle:
+            pass
+
+        class Resource(BaseModel):
+            model_config = ConfigDict(arbitrary_types_allowed=True)
+            rid: str
+            handle: Handle | None = None
+
+        memory = OMem(
+            memory_schema=Resource,
+            key_extractor=lambda x: x.rid,
+            llm_client=None,
+            embedder=None,
+            strategy_or_merger=merger
+        )
+        handle = Handle()
+        memory.add([Resource(rid="r1"), Resource(rid="r1", handle=handle)])
+
+        merger.merge.assert_called_once()
+        assert memory.get("r1").handle is handle
+
+
 # ============================================================================
 # CustomRuleMerger Tests
 # ============================================================================
@@ -507,3 +698,390 @@ class TestCustomRuleMergerRealUseCases:
         prompt = merger.system_prompt
         assert "Base rule" in prompt
         assert "production mode" in prompt
+
+
+class TestLLMMergeCache:
+    """Test caching of LLM merge results."""
+
+    @pytest.fixture
+    def llm(self):
+        return FakeStructuredLLM(Person(id="p1", name="Alice Smith", age=30))
+
+    @pytest.fixture
+    def merger(self, llm):
+        return create_merger(
+            MergeStrategy.LLM.BALANCED,
+            key_extractor=lambda x: x.id,
+            llm_client=llm,
+            item_schema=Person,
+        )
+
+    def test_repeated_pairs_hit_cache(self, merger, llm):
+        """Test identical pairs are only sent to the LLM once."""
+        pair = (Person(id="p1", name="Alice"), Person(id="p1", name="A. Smith", age=30))
+
+        first = merger.batch_merge([pair])
+        second = merger.batch_merge([pair, pair])
+        third = merger.pair_merge(*pair)
+
+        assert llm.calls == 1
+        assert first[0] == second[0] == second[1] == third
+
+    def test_cache_hits_are_independent_copies(self, merger, llm):
+        """Test mutating a merged item does not change later cache hits."""
+        pair = (Person(id="p1", name="Alice"), Person(id="p1", name="A. Smith", age=30))
+
+        first = merger.pair_merge(*pair)
+        first.age = 99
+        second = merger.pair_merge(*pair)
+        second.name = "Mallory"
+        third = merger.batch_merge([pair])[0]
+
+        assert llm.calls == 1
+        assert third == Person(id="p1", name="Alice Smith", age=30)
+
+    def test_prompt_change_misses_cache(self, llm):
+        """Test that a different rule is a different cache entry."""
+        context = {"rule": "Rule A"}
+        merger = CustomRuleMerger(
+            key_extractor=lambda x: x.id,
+            llm_client=llm,
+            item_schema=Person,
+            rule="Merge records.",
+            dynamic_rule=lambda: context["rule"],
+        )
+        pair = (Person(id="p1", name="Alice"), Person(id="p1", name="A. Smith", age=30))
+
+        merger.batch_merge([pair])
+        context["rule"] = "Rule B"
+        merger.batch_merge([pair])
+
+        assert llm.calls == 2
+
+    def test_cache_persists_with_memory(self, llm, tmp_path):
+        """Test the cache is saved by dump() and served after load()."""
+        def make_memory():
+            return OMem(
+                memory_schema=Person,
+                key_extractor=lambda x: x.id,
+                llm_client=llm,
+                embedder=None,
+                strategy_or_merger=MergeStrategy.LLM.BALANCED,
+            )
+
+        memory = make_memory()
+        memory.add([Person(id="p1", name="Alice"), Person(id="p1", name="A. Smith", age=30)])
+        memory.dump(tmp_path)
+        assert (tmp_path / "merge_cache.json").exists()
+
+        restored = make_memory()
+        restored.load(tmp_path)
+        restored._merger.batch_merge(
+            [(Person(id="p1", name="Alice"), Person(id="p1", name="A. Smith", age=30))]
+        )
+
+        assert llm.calls == 1
+
+    def test_cache_path_persists_across_mergers(self, llm, tmp_path):
+        """Test a merger with cache_path serves results cached by an earlier run."""
+        cache_path = tmp_path / "cache" / "merges.json"
+        pair = (Person(id="p1", name="Alice"), Person(id="p1", name="A. Smith", age=30))
+
+        def make_merger():
+            return create_merger(
+                MergeStrategy.LLM.BALANCED,
+                key_extractor=lambda x: x.id,
+                llm_client=llm,
+                item_schema=Person,
+                cache_path=cache_path,
+            )
+
+        make_merger().batch_merge([pair])
+        assert cache_path.exists()
+
+        result = make_merger().batch_merge([pair])
+
+        assert llm.calls == 1
+        assert result[0] == Person(id="p1", name="Alice Smith", age=30)
+
+    def test_cache_size_evicts_least_recently_used(self, llm):
+        """Test a bounded cache keeps only the most recently used results."""
+        merger = create_merger(
+            MergeStrategy.LLM.BALANCED,
+            key_extractor=lambda x: x.id,
+            llm_client=llm,
+            item_schema=Person,
+            cache_size=2,
+        )
+        pairs = [
+            (Person(id="p1", name="Alice"), Person(id="p1", name=name))
+            for name in ("A. Smith", "Alicia", "Ally")
+        ]
+
+        merger.batch_merge(pairs[:2])
+        merger.batch_merge([pairs[0]])
+        merger.batch_merge([pairs[2]])
+        assert llm.calls == 3
+
+        merger.batch_merge([pairs[0]])
+        assert llm.calls == 3
+        merger.batch_merge([pairs[1]])
+        assert llm.calls == 4
+        assert len(merger._cache) == 2
+
+    def test_cache_is_bounded_by_default(self, merger, llm):
+        """Test the cache defaults to 128 entries and None opts out of the bound."""
+        assert merger.cache_size == 128
+
+        unbounded = create_merger(
+            MergeStrategy.LLM.BALANCED,
+            key_extractor=lambda x: x.id,
+            llm_client=llm,
+            item_schema=Person,
+            cache_size=None,
+        )
+        unbounded.batch_merge([
+            (Person(id="p1", name="Alice"), Person(id="p1", name=f"Alice {i}"))
+            for i in range(130)
+        ])
+        assert len(unbounded._cache) == 130
+
+    def test_prompt_omits_none_fields(self, merger, llm):
+        """Test records are sent to the LLM without their None fields."""
+        merger.pair_merge(
+            Person(id="p1", name="Alice"), Person(id="p1", name="Alicia", age=30)
+        )
+
+        assert llm.calls == 1
+        assert '{"id":"p1","name":"Alice"}' in llm.prompts[0]
+        assert "email" not in llm.prompts[0]
+
+    def test_unserializable_pair_bypasses_cache(self):
+        """Test pairs that cannot be serialized are merged without the cache."""
+        class Handle:
+            def __str__(self):
+                return "handle"
+
+        class Resource(BaseModel):
+            rid: str
+            name: str | None = None
+            handle: Any = None
+
+        merged = Resource(rid="r1", name="merged")
+        llm = FakeStructuredLLM(merged)
+        merger = create_merger(
+            MergeStrategy.LLM.BALANCED,
+            key_extractor=lambda x: x.rid,
+            llm_client=llm,
+            item_schema=Resource,
+        )
+        pair = (Resource(rid="r1", name="a", handle=Handle()), Resource(rid="r1", name="b"))
+
+        results = merger.batch_merge([pair, pair])
+
+        assert results == [merged, merged]
+        assert llm.calls == 2
+        assert '"handle":"handle"' in llm.prompts[0]
+        assert len(merger._cache) == 0
+
+    def test_schema_change_misses_cache(self, merger, llm):
+        """Test cache keys include the item schema."""
+        class PersonV2(Person):
+            nickname: str | None = None
+
+        other = create_merger(
+            MergeStrategy.LLM.BALANCED,
+            key_extractor=lambda x: x.id,
+            llm_client=llm,
+            item_schema=PersonV2,
+        )
+        pair = (Person(id="p1", name="Alice"), Person(id="p1", name="A. Smith", age=30))
+
+        assert merger._cache_key("prompt", *pair) != other._cache_key("prompt", *pair)
+
+
+class TestTrivialMergeSkip:
+    """Test pairs where one side adds nothing skip the LLM."""
+
+    @pytest.fixture
+    def llm(self):
+        return FakeStructuredLLM(Person(id="p1", name="Alice Smith", age=30))
+
+    @pytest.fixture
+    def merger(self, llm):
+        return create_merger(
+            MergeStrategy.LLM.BALANCED,
+            key_extractor=lambda x: x.id,
+            llm_client=llm,
+            item_schema=Person,
+        )
+
+    def test_empty_incoming_keeps_existing(self, merger, llm):
+        """Test an incoming item with only empty fields returns existing."""
+        existing = Person(id="p1", name="Alice", age=30)
+
+        results = merger.batch_merge([(existing, Person(id="p1"))])
+
+        assert results == [existing]
+        assert llm.calls == 0
+
+    def test_subset_existing_keeps_incoming(self, merger, llm):
+        """Test an existing item contained in incoming returns incoming."""
+        incoming = Person(id="p1", name="Alice", email="a@example.com")
+
+        result = merger.pair_merge(Person(id="p1", name="Alice"), incoming)
+
+        assert result == incoming
+        assert llm.calls == 0
+
+    def test_list_subset_keeps_existing(self, llm):
+        """Test list fields already covered by existing skip the LLM."""
+        merger = create_merger(
+            MergeStrategy.LLM.BALANCED,
+            key_extractor=lambda x: x.uid,
+            llm_client=llm,
+            item_schema=Profile,
+        )
+        existing = Profile(uid="p1", name="Alice", skills=["python", "rust", "go"])
+
+        results = merger.batch_merge([
+            (existing, Profile(uid="p1", skills=["go", "python"])),
+            (existing, Profile(uid="p1", skills=["go", "zig"])),
+        ])
+
+        assert results[0] == existing
+        assert llm.calls == 1
+
+    def test_new_information_still_calls_llm(self, merger, llm):
+        """Test complementary pairs reach the LLM by default."""
+        existing = Person(id="p1", name="Alice")
+
+        results = merger.batch_merge([
+            (existing, Person(id="p1", age=30)),
+            (existing, Person(id="p1", name="Alice")),
+            (existing, Person(id="p1", name="Alicia")),
+        ])
+
+        assert llm.calls == 2
+        assert results[1] == existing
+
+    def test_union_conflict_free_merges_without_llm(self, llm):
+        """Test opting in unions complementary pairs but not conflicting ones."""
+        merger = create_merger(
+            MergeStrategy.LLM.BALANCED,
+            key_extractor=lambda x: x.uid,
+            llm_client=llm,
+            item_schema=Profile,
+            union_conflict_free=True,
+        )
+        existing = Profile(uid="p1", name="Alice", skills=["python"])
+
+        results = merger.batch_merge([
+            (existing, Profile(uid="p1", skills=["go", "go"], bio="Dev")),
+            (existing, Profile(uid="p1", name="Alicia")),
+        ])
+
+        assert results[0] == Profile(
+            uid="p1", name="Alice", skills=["python", "go"], bio="Dev"
+        )
+        assert llm.calls == 1
+
+    def test_union_runs_schema_validators(self):
+        """Test unioned results are validated, so validators still apply."""
+        class Capped(BaseModel):
+            uid: str
+            notes: list[str] = []
+            bio: str | None = None
+
+            @field_validator("notes")
+            @classmethod
+            def keep_two(cls, notes):
+                return notes[-2:]
+
+        llm = FakeStructuredLLM(Capped(uid="c1"))
+        merger = create_merger(
+            MergeStrategy.LLM.BALANCED,
+            key_extractor=lambda x: x.uid,
+            llm_client=llm,
+            item_schema=Capped,
+            union_conflict_free=True,
+        )
+
+        result = merger.pair_merge(
+            Capped(uid="c1", notes=["a", "b"]), Capped(uid="c1", notes=["c"], bio="x")
+        )
+
+        assert result.notes == ["b", "c"]
+        assert llm.calls == 0
+
+    def test_custom_rule_never_unions(self, llm):
+        """Test custom rules see complementary pairs and reject the opt-in."""
+        merger = create_merger(
+            MergeStrategy.LLM.CUSTOM_RULE,
+            key_extractor=lambda x: x.id,
+            llm_client=llm,
+            item_schema=Person,
+            rule="Sum ages.",
+        )
+
+        merger.pair_merge(Person(id="p1", name="Alice"), Person(id="p1", age=30))
+
+        assert llm.calls == 1
+        with pytest.raises(ValueError):
+            create_merger(
+                MergeStrategy.LLM.CUSTOM_RULE,
+                key_extractor=lambda x: x.id,
+                llm_client=llm,
+                item_schema=Person,
+                rule="Sum ages.",
+                union_conflict_free=True,
+            )
+
+
+class TestPromptPrefixCaching:
+    """Test merge prompts are laid out for provider prefix caching."""
+
+    def _system_message(self, llm_type):
+        llm = Mock()
+        llm._llm_type = llm_type
+        merger = create_merger(
+            MergeStrategy.LLM.BALANCED,
+            key_extractor=lambda x: x.id,
+            llm_client=llm,
+            item_schema=Person,
+        )
+        messages = merger.build_prompt().format_messages(
+            item_existing="{}", item_incoming="{}"
+        )
+        assert messages[0].type == "system"
+        assert messages[-1].content.startswith("Item A (existing)")
+        return messages[0]
+
+    def test_anthropic_system_block_marked_cacheable(self):
+        """Test Anthropic models get cache_control on the system block."""
+        system = self._system_message("anthropic-chat")
+
+        assert system.content[0]["cache_control"] == {"type": "ephemeral"}
+
+    def test_other_models_get_plain_system_prompt(self):
+        """Test other providers receive the system prompt as plain text."""
+        system = self._system_message("openai-chat")
+
+        assert isinstance(system.content, str)
+
+    def test_merge_chain_reused_until_prompt_changes(self):
+        """Test the compiled merge chain is rebuilt only for a new system prompt."""
+        context = {"rule": "Rule A"}
+        merger = CustomRuleMerger(
+            key_extractor=lambda x: x.id,
+            llm_client=FakeStructuredLLM(Person(id="p1")),
+            item_schema=Person,
+            rule="Merge records.",
+            dynamic_rule=lambda: context["rule"],
+        )
+
+        first = merger._merge_chain(merger.system_prompt)
+        assert merger._merge_chain(merger.system_prompt) is first
+
+        context["rule"] = "Rule B"
+        assert merger._merge_chain(merger.system_prompt) is not first
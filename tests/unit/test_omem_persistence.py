@@ -1,6 +1,9 @@
 """Unit tests for save/load functionality."""
+import os
+import stat
 import pytest
 import json
+from datetime import datetime
 from pydantic import BaseModel
 from ontomem import OMem
 from ontomem.merger import MergeStrategy
@@ -12,6 +15,12 @@ class Item(BaseModel):
     value: int = 0
 
 
+class Event(BaseModel):
+    event_id: str
+    when: datetime
+    tags: list[str] = []
+
+
 class TestPersistence:
     """Test dump and load functionality."""
 
@@ -153,3 +162,88 @@ class TestPersistence:
         assert memory2.size == 2
         assert memory2.get("1") is None
         assert memory2.get("2").name == "Bob"
+
+    def test_load_restores_typed_fields(self, temp_dir):
+        """Test that loaded items are validated back into their field types."""
+        memory = OMem(
+            memory_schema=Event,
+            key_extractor=lambda x: x.event_id,
+            llm_client=None,
+            embedder=None,
+            strategy_or_merger=MergeStrategy.MERGE_FIELD
+        )
+        memory.add(Event(event_id="e1", when=datetime(2024, 5, 1, 12, 30), tags=["a"]))
+        memory.dump(temp_dir)
+
+        memory2 = OMem(
+            memory_schema=Event,
+            key_extractor=lambda x: x.event_id,
+            llm_client=None,
+            embedder=None,
+            strategy_or_merger=MergeStrategy.MERGE_FIELD
+        )
+        memory2.load(temp_dir)
+
+        loaded = memory2.get("e1")
+        assert isinstance(loaded, Event)
+        assert loaded.when == datetime(2024, 5, 1, 12, 30)
+
+    def test_failed_dump_keeps_previous_file(self, memory, temp_dir, monkeypatch):
+        """Test an interrupted dump leaves the last good memory.json in place."""
+        memory.add(Item(item_id="1", name="Alice"))
+        memory.dump(temp_dir)
+        saved = (temp_dir / "memory.json").read_bytes()
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("ontomem.utils.io.os.replace", fail_replace)
+        memory.add(Item(item_id="2", name="Bob"))
+        with pytest.raises(OSError):
+            memory.dump_data(temp_dir / "memory.json")
+
+        assert (temp_dir / "memory.json").read_bytes() == saved
+        assert not list(temp_dir.glob("*.tmp"))
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    def test_atomic_write_permissions(self, temp_dir):
+        """Test new files follow the umask and rewrites keep the target's mode."""
+        from ontomem.utils import write_bytes_atomic
+
+        temp_dir.mkdir()
+        target = temp_dir / "memory.json"
+        old_umask = os.umask(0o027)
+        try:
+            write_bytes_atomic(target, b"v1")
+        finally:
+            os.umask(old_umask)
+        assert stat.S_IMODE(target.stat().st_mode) == 0o640
+
+        target.chmod(0o604)
+        write_bytes_atomic(target, b"v2", fsync=True)
+        assert target.read_bytes() == b"v2"
+        assert stat.S_IMODE(target.stat().st_mode) == 0o604
+
+    def test_staged_folder_swaps_files_only_on_success(self, temp_dir):
+        """Test staged files replace the folder's files only if staging succeeds."""
+        from ontomem.utils import staged_folder
+
+        with staged_folder(temp_dir) as staging:
+            (staging / "index.faiss").write_bytes(b"v1")
+            (staging / "index.pkl").write_bytes(b"v1")
+        assert (temp_dir / "index.faiss").read_bytes() == b"v1"
+
+        (temp_dir / "notes.txt").write_bytes(b"user file")
+        with staged_folder(temp_dir) as staging:
+            (staging / "index.faiss").write_bytes(b"v2")
+        assert (temp_dir / "index.faiss").read_bytes() == b"v2"
+        assert (temp_dir / "index.pkl").read_bytes() == b"v1"
+        assert (temp_dir / "notes.txt").read_bytes() == b"user file"
+
+        with pytest.raises(OSError):
+            with staged_folder(temp_dir) as staging:
+                (staging / "index.faiss").write_bytes(b"partial")
+                raise OSError("disk full")
+
+        assert (temp_dir / "index.faiss").read_bytes() == b"v2"
+        assert not list(temp_dir.parent.glob(".*.tmp"))
@@ -1,7 +1,9 @@
 """Unit tests for search and indexing."""
+import json
 import pytest
 from pydantic import BaseModel
-from ontomem import OMem
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from ontomem import OMem, IndexType
 from ontomem.merger import MergeStrategy
 
 
@@ -12,6 +14,21 @@ class Document(BaseModel):
     tags: list[str] = []
 
 
+class CountingEmbedder(DeterministicFakeEmbedding):
+    """Deterministic offline embedder that records embed_documents/embed_query calls."""
+
+    calls: list[int] = []
+    queries: list[str] = []
+
+    def embed_documents(self, texts):
+        self.calls.append(len(texts))
+        return super().embed_documents(texts)
+
+    def embed_query(self, text):
+        self.queries.append(text)
+        return super().embed_query(text)
+
+
 class TestIndexing:
     """Test vector index building."""
 
@@ -175,3 +192,397 @@ class TestSearch:
 
         assert len(results_k1) <= 1
         assert len(results_k3) <= 3
+
+
+class TestIncrementalIndex:
+    """Test batched embedding and incremental index maintenance (offline)."""
+
+    @pytest.fixture
+    def embedder(self):
+        return CountingEmbedder(size=16, calls=[], queries=[])
+
+    @pytest.fixture
+    def memory(self, embedder):
+        return OMem(
+            memory_schema=Document,
+            key_extractor=lambda x: x.doc_id,
+            llm_client=None,
+            embedder=embedder,
+            strategy_or_merger=MergeStrategy.MERGE_FIELD
+        )
+
+    def test_build_index_single_batch(self, memory, embedder):
+        """Test that building the index embeds all items in one call."""
+        memory.add([
+            Document(doc_id=str(i), title=f"Doc {i}", content=f"Content {i}")
+            for i in range(10)
+        ])
+        memory.build_index()
+
+        assert embedder.calls == [10]
+
+    def test_add_keeps_index_and_embeds_only_changes(self, memory, embedder):
+        """Test that adding to an indexed memory re-embeds only touched items."""
+        memory.add([
+            Document(doc_id="1", title="Python", content="Python basics"),
+            Document(doc_id="2", title="Rust", content="Rust basics"),
+        ])
+        memory.build_index()
+
+        memory.add([
+            Document(doc_id="2", title="Rust", content="Ownership"),
+            Document(doc_id="3", title="Go", content="Goroutines"),
+        ])
+        assert memory.has_index()
+
+        results = memory.search("Go", top_k=10)
+
+        assert embedder.calls == [2, 2]
+        assert {r.doc_id for r in results} == {"1", "2", "3"}
+        assert memory._index.index.ntotal == 3
+
+    def test_unchanged_embedding_text_keeps_vector(self, embedder):
+        """Test a merge outside fields_for_index does not re-embed the item."""
+        memory = OMem(
+            memory_schema=Document,
+            key_extractor=lambda x: x.doc_id,
+            llm_client=None,
+            embedder=embedder,
+            strategy_or_merger=MergeStrategy.MERGE_FIELD,
+            fields_for_index=["title"],
+        )
+        memory.add(Document(doc_id="1", title="Python", content="Python basics"))
+        memory.build_index()
+
+        memory.add(Document(doc_id="1", title="Python", content="Decorators"))
+        results = memory.search("Python", top_k=1)
+
+        assert embedder.calls == [1]
+        assert results[0].content == "Decorators"
+        assert memory._index.index.ntotal == 1
+
+    def test_search_batch_matches_search(self, memory, embedder):
+        """Test batched search returns the same rankings as single searches."""
+        memory.add([
+            Document(doc_id=str(i), title=f"Doc {i}", content=f"Content {i}")
+            for i in range(6)
+        ])
+        queries = ["Doc 1", "Content 4", "Doc 1"]
+
+        batched = memory.search_batch(queries, top_k=3)
+
+        assert [[d.doc_id for d in hits] for hits in batched] == [
+            [d.doc_id for d in memory.search(query, top_k=3)] for query in queries
+        ]
+        assert embedder.queries == ["Doc 1", "Content 4"]
+
+    def test_search_batch_top_k_beyond_size(self, memory):
+        """Test rows are not padded when top_k exceeds the stored items."""
+        memory.add(Document(doc_id="1", title="Python", content="Basics"))
+
+        assert memory.search_batch(["Python", "Rust"], top_k=5) == [
+            [memory.get("1")], [memory.get("1")]
+        ]
+        assert memory.search_batch([]) == []
+
+    def test_index_uses_normalized_inner_product(self, memory):
+        """Test that vectors are L2-normalized in an inner-product index."""
+        import faiss
+        import numpy as np
+
+        memory.add([
+            Document(doc_id="1", title="Python", content="Python basics"),
+            Document(doc_id="2", title="Rust", content="Rust basics"),
+        ])
+        memory.build_index()
+
+        index = memory._index.index
+        assert index.metric_type == faiss.METRIC_INNER_PRODUCT
+        vectors = index.reconstruct_n(0, index.ntotal)
+        assert np.allclose(np.linalg.norm(vectors, axis=1), 1.0, atol=1e-5)
+
+        # Exact text of an item is its own nearest neighbour
+        query = memory._serialize_for_embedding(memory.get("2"))
+        assert memory.search(query, top_k=1)[0].doc_id == "2"
+
+    def test_repeated_query_embedded_once(self, memory, embedder):
+        """Test that repeating a search query reuses its cached embedding."""
+        memory.add([
+            Document(doc_id="1", title="Python", content="Python basics"),
+            Document(doc_id="2", title="Rust", content="Rust basics"),
+        ])
+
+        first = memory.search("systems language", top_k=2)
+        second = memory.search("systems language", top_k=2)
+        memory.search("scripting", top_k=2)
+
+        assert embedder.queries == ["systems language", "scripting"]
+        assert first == second
+
+    def test_remove_drops_vector(self, memory):
+        """Test that removed items are no longer returned by search."""
+        memory.add([
+            Document(doc_id="1", title="Python", content="Python basics"),
+            Document(doc_id="2", title="Rust", content="Rust basics"),
+        ])
+        memory.build_index()
+
+        memory.remove("1")
+        results = memory.search("Python", top_k=10)
+
+        assert [r.doc_id for r in results] == ["2"]
+        assert memory._index.index.ntotal == 1
+
+    def test_indexing_reuses_stored_keys(self, embedder):
+        """Test that building and refreshing the index never re-extracts keys."""
+        extracted = []
+        memory = OMem(
+            memory_schema=Document,
+            key_extractor=lambda x: extracted.append(x.doc_id) or x.doc_id,
+            llm_client=None,
+            embedder=embedder,
+            strategy_or_merger=MergeStrategy.MERGE_FIELD
+        )
+        memory.add([
+            Document(doc_id=str(i), title=f"Doc {i}", content=f"Content {i}")
+            for i in range(5)
+        ])
+        assert len(extracted) == 5
+
+        memory.build_index()
+        memory.add(Document(doc_id="1", title="Updated", content="New"))
+        memory.search("New", top_k=1)
+
+        # add(): 1 to group, 2 in the merger (stored + incoming), 1 for the result
+        assert len(extracted) == 5 + 4
+
+    def test_incremental_index_persistence(self, memory, embedder, tmp_path):
+        """Test that pending changes are flushed on dump and ids restored on load."""
+        memory.add(Document(doc_id="1", title="Python", content="Python basics"))
+        memory.build_index()
+        memory.add(Document(doc_id="2", title="Rust", content="Rust basics"))
+        memory.dump(tmp_path)
+
+        restored = OMem(
+            memory_schema=Document,
+            key_extractor=lambda x: x.doc_id,
+            llm_client=None,
+            embedder=embedder,
+            strategy_or_merger=MergeStrategy.MERGE_FIELD
+        )
+        restored.load(tmp_path)
+
+        assert restored._index.index.ntotal == 2
+        assert set(restored._doc_ids) == {"1", "2"}
+
+
+class TestFindDuplicates:
+    """Test near-duplicate detection over the vector index (offline)."""
+
+    def _memory(self, index_type=IndexType.FLAT):
+        memory = OMem(
+            memory_schema=Document,
+            key_extractor=lambda x: x.doc_id,
+            llm_client=None,
+            embedder=CountingEmbedder(size=16, calls=[]),
+            strategy_or_merger=MergeStrategy.MERGE_FIELD,
+            fields_for_index=["content"],
+            index_type=index_type,
+        )
+        memory.add([
+            Document(doc_id=str(i), title=f"Doc {i}", content=f"Content {i}")
+            for i in range(10)
+        ])
+        memory.add([
+            Document(doc_id="copy-2", title="Copy", content="Content 2"),
+            Document(doc_id="copy-8", title="Copy", content="Content 8"),
+        ])
+        return memory
+
+    @pytest.mark.parametrize("index_type", [IndexType.FLAT, IndexType.HNSW])
+    def test_finds_pairs_across_batches(self, index_type):
+        """Test identical content is paired even when split across batches."""
+        memory = self._memory(index_type)
+
+        pairs = memory.find_duplicates(threshold=0.99, batch_size=3)
+
+        assert {frozenset(p[:2]) for p in pairs} == {
+            frozenset({"2", "copy-2"}),
+            frozenset({"8", "copy-8"}),
+        }
+        assert all(sim == pytest.approx(1.0, abs=1e-4) for _, _, sim in pairs)
+
+    def test_reflects_pending_changes(self):
+        """Test removals since the last search are taken into account."""
+        memory = self._memory()
+        memory.build_index()
+        memory.remove("copy-8")
+
+        pairs = memory.find_duplicates(threshold=0.99)
+
+        assert [frozenset(p[:2]) for p in pairs] == [frozenset({"2", "copy-2"})]
+
+
+class TestIndexTypes:
+    """Test configurable FAISS index types (offline)."""
+
+    def _memory(self, index_type):
+        return OMem(
+            memory_schema=Document,
+            key_extractor=lambda x: x.doc_id,
+            llm_client=None,
+            embedder=CountingEmbedder(size=16, calls=[]),
+            strategy_or_merger=MergeStrategy.MERGE_FIELD,
+            index_type=index_type,
+        )
+
+    def _docs(self, n):
+        return [
+            Document(doc_id=str(i), title=f"Doc {i}", content=f"Content {i}")
+            for i in range(n)
+        ]
+
+    def test_invalid_index_type_raises(self):
+        """Test that unknown index types are rejected at init."""
+        with pytest.raises(ValueError):
+            self._memory("annoy")
+
+    @pytest.mark.parametrize("index_type", ["hnsw", IndexType.AUTO])
+    def test_hnsw_index(self, index_type):
+        """Test HNSW index build, incremental update and removal."""
+        import faiss
+
+        memory = self._memory(index_type)
+        memory.add(self._docs(20))
+        memory.build_index()
+        assert isinstance(memory._index.index, faiss.IndexHNSWFlat)
+
+        memory.remove("3")
+        memory.add(Document(doc_id="3b", title="New", content="Fresh"))
+        results = memory.search("Content 5", top_k=20)
+
+        ids = {r.doc_id for r in results}
+        assert "3" not in ids
+        assert "3b" in ids
+        assert memory._index.index.ntotal == 20
+
+    def test_flat_fp16_index(self, tmp_path):
+        """Test float16 flat index supports removal and persistence."""
+        import faiss
+
+        memory = self._memory(IndexType.FLAT_FP16)
+        memory.add(self._docs(10))
+        memory.build_index()
+        assert isinstance(memory._index.index, faiss.IndexScalarQuantizer)
+
+        memory.remove("2")
+        memory.dump_index(tmp_path / "faiss_index")
+
+        loaded = self._memory(IndexType.FLAT_FP16)
+        loaded.add([d for d in self._docs(10) if d.doc_id != "2"])
+        loaded.load_index(tmp_path / "faiss_index")
+        results = loaded.search("Content 4", top_k=10)
+
+        assert isinstance(loaded._index.index, faiss.IndexScalarQuantizer)
+        assert loaded._index.index.ntotal == 9
+        assert "2" not in {r.doc_id for r in results}
+
+    def test_flat_int8_index(self):
+        """Test int8 flat index is trained and supports removal."""
+        import faiss
+
+        memory = self._memory(IndexType.FLAT_INT8)
+        memory.add(self._docs(300))
+        memory.build_index()
+        index = memory._index.index
+        assert isinstance(index, faiss.IndexScalarQuantizer)
+        assert index.sq.qtype == faiss.ScalarQuantizer.QT_8bit
+        assert index.is_trained
+
+        memory.remove("7")
+        results = memory.search("Content 7", top_k=300)
+
+        assert memory._index.index.ntotal == 299
+        assert "7" not in {r.doc_id for r in results}
+
+    def test_flat_int8_falls_back_to_fp16_for_small_stores(self, tmp_path):
+        """Test int8 index falls back to float16 when too small to train."""
+        import faiss
+
+        memory = self._memory(IndexType.FLAT_INT8)
+        memory.add(self._docs(5))
+        memory.build_index()
+
+        index = memory._index.index
+        assert isinstance(index, faiss.IndexScalarQuantizer)
+        assert index.sq.qtype == faiss.ScalarQuantizer.QT_fp16
+
+        memory.dump(tmp_path)
+        metadata = json.loads((tmp_path / "metadata.json").read_text())
+        assert metadata["index_type"] == "flat_int8"
+        assert metadata["built_index_type"] == "flat_fp16"
+
+    def test_training_sample_is_bounded_and_seeded(self, monkeypatch):
+        """Test quantizers are trained on a reproducible bounded sample."""
+        import numpy as np
+        from ontomem.core import faiss_index
+
+        vectors = np.random.default_rng(1).random((300, 16), dtype=np.float32)
+        sample = faiss_index._training_sample(vectors, 100)
+
+        assert sample.shape == (100, 16)
+        assert np.array_equal(sample, faiss_index._training_sample(vectors, 100))
+        assert faiss_index._training_sample(vectors, 500) is vectors
+
+        monkeypatch.setattr(faiss_index, "TRAIN_SAMPLE_SIZE", 260)
+        index = faiss_index.create_faiss_index(IndexType.FLAT_INT8, vectors)
+        assert index.is_trained
+
+    @pytest.mark.parametrize(
+        "index_type, index_cls",
+        [(IndexType.IVF_PQ, "IndexIVFPQ"), (IndexType.IVF_FLAT, "IndexIVFFlat")],
+    )
+    def test_ivf_index(self, index_type, index_cls):
+        """Test IVF indexes are trained and support removal."""
+        import faiss
+
+        memory = self._memory(index_type)
+        memory.add(self._docs(300))
+        memory.build_index()
+        assert isinstance(memory._index.index, getattr(faiss, index_cls))
+
+        memory.remove("7")
+        results = memory.search("Content 7", top_k=300)
+
+        assert memory._index.index.ntotal == 299
+        assert "7" not in {r.doc_id for r in results}
+
+    def test_binary_index(self, tmp_path):
+        """Test binary index stores one bit per dimension and supports removal."""
+        import faiss
+
+        memory = self._memory(IndexType.BINARY)
+        memory.add(self._docs(10))
+        memory.build_index()
+        index = memory._index.index
+        assert isinstance(index, faiss.IndexLSH)
+        assert index.code_size == 16 // 8
+
+        memory.remove("2")
+        memory.dump_index(tmp_path / "faiss_index")
+        results = memory.search("Content 4", top_k=10)
+
+        assert memory._index.index.ntotal == 9
+        assert {r.doc_id for r in results} == {d.doc_id for d in self._docs(10)} - {"2"}
+        with pytest.raises(ValueError):
+            memory.find_duplicates()
+
+    def test_ivfpq_falls_back_to_flat_for_small_stores(self):
+        """Test IVF-PQ falls back to exact search when too small to train."""
+        import faiss
+
+        memory = self._memory(IndexType.IVF_PQ)
+        memory.add(self._docs(5))
+        memory.build_index()
+
+        assert isinstance(memory._index.index, faiss.IndexFlat)